@@ -21,6 +21,8 @@ from jobspy.util import (
     get_enum_from_value,
     map_str_to_site,
     convert_to_annual,
+    compact_job_dtypes,
+    stable_job_id,
     desired_order,
 )
 from jobspy.ziprecruiter import ZipRecruiter
@@ -44,11 +46,15 @@ def scrape_jobs(
     description_format: str = "markdown",
     linkedin_fetch_description: bool | None = False,
     linkedin_company_ids: list[int] | None = None,
+    naukri_fetch_description: bool | None = False,
+    bdjobs_fetch_description: bool | None = True,
+    bayt_fetch_description: bool | None = False,
     offset: int | None = 0,
     hours_old: int = None,
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    compact_dtypes: bool = False,
     **kwargs,
 ) -> pd.DataFrame:
     """
@@ -97,6 +103,9 @@ def scrape_jobs(
         linkedin_fetch_description=linkedin_fetch_description,
         results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
+        naukri_fetch_description=naukri_fetch_description,
+        bdjobs_fetch_description=bdjobs_fetch_description,
+        bayt_fetch_description=bayt_fetch_description,
         offset=offset,
         hours_old=hours_old,
     )
@@ -132,6 +141,8 @@ def scrape_jobs(
         for job in job_response.jobs:
             job_data = job.dict()
             job_url = job_data["job_url"]
+            if not job_data["id"]:
+                job_data["id"] = stable_job_id(site, job_url)
             job_data["site"] = site
             job_data["company"] = job_data["company_name"]
             job_data["job_type"] = (
@@ -213,6 +224,9 @@ def scrape_jobs(
         # Reorder the DataFrame according to the desired order
         jobs_df = jobs_df[desired_order]
 
+        if compact_dtypes:
+            jobs_df = compact_job_dtypes(jobs_df)
+
         # Step 4: Sort the DataFrame as required
         return jobs_df.sort_values(
             by=["site", "date_posted"], ascending=[True, False]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import random
-import time
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup
 
@@ -13,8 +15,19 @@ from jobspy.model import (
     JobResponse,
     Location,
     Country,
+    DescriptionFormat,
+)
+from jobspy.util import (
+    create_logger,
+    create_session,
+    markdown_converter,
+    plain_converter,
+    remove_attributes,
+    extract_emails_from_text,
+    canonicalize_url,
+    stable_job_id,
+    RateLimiter,
 )
-from jobspy.util import create_logger, create_session
 
 log = create_logger("Bayt")
 
@@ -23,9 +36,16 @@ class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
     delay = 2
     band_delay = 3
+    jobs_per_page = 20
+    max_workers = 3
+    # shared by every Bayt scraper and worker thread in the process
+    limiter = RateLimiter(delay, band_delay)
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
     ):
         super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert)
         self.scraper_input = None
@@ -38,47 +58,70 @@ class BaytScraper(Scraper):
             proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
         )
         job_list: list[JobPost] = []
+        seen_ids = set()
         page = 1
         results_wanted = (
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
         while len(job_list) < results_wanted:
-            log.info(f"Fetching Bayt jobs page {page}")
-            job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
-            if not job_elements:
-                break
+            pages_short = math.ceil(
+                (results_wanted - len(job_list)) / self.jobs_per_page
+            )
+            pages = list(range(page, page + pages_short))
+            page += pages_short
+            log.info(f"Fetching Bayt jobs pages {pages[0]}-{pages[-1]}")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda p: self._fetch_jobs(self.scraper_input.search_term, p),
+                        pages,
+                    )
+                )
+
+            exhausted = False
+            for page_num, job_elements in zip(pages, results):
+                if not job_elements:
+                    exhausted = True
+                    break
 
-            if job_elements:
                 log.debug(
                     "First job element snippet:\n" + job_elements[0].prettify()[:500]
                 )
 
-            initial_count = len(job_list)
-            for job in job_elements:
-                try:
-                    job_post = self._extract_job_info(job)
-                    if job_post:
-                        job_list.append(job_post)
-                        if len(job_list) >= results_wanted:
-                            break
-                    else:
-                        log.debug(
-                            "Extraction returned None. Job snippet:\n"
-                            + job.prettify()[:500]
-                        )
-                except Exception as e:
-                    log.error(f"Bayt: Error extracting job info: {str(e)}")
-                    continue
-
-            if len(job_list) == initial_count:
-                log.info(f"No new jobs found on page {page}. Ending pagination.")
+                initial_count = len(job_list)
+                for job in job_elements:
+                    try:
+                        job_post = self._extract_job_info(job)
+                        if job_post and job_post.id not in seen_ids:
+                            seen_ids.add(job_post.id)
+                            job_list.append(job_post)
+                            if len(job_list) >= results_wanted:
+                                break
+                        elif not job_post:
+                            log.debug(
+                                "Extraction returned None. Job snippet:\n"
+                                + job.prettify()[:500]
+                            )
+                    except Exception as e:
+                        log.error(f"Bayt: Error extracting job info: {str(e)}")
+                        continue
+
+                if len(job_list) == initial_count:
+                    log.info(
+                        f"No new jobs found on page {page_num}. Ending pagination."
+                    )
+                    exhausted = True
+                    break
+                if len(job_list) >= results_wanted:
+                    break
+
+            if exhausted:
                 break
 
-            page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-
         job_list = job_list[: scraper_input.results_wanted]
+        if scraper_input.bayt_fetch_description:
+            self._add_descriptions(job_list)
         return JobResponse(jobs=job_list)
 
     def _fetch_jobs(self, query: str, page: int) -> list | None:
@@ -87,6 +130,7 @@ class BaytScraper(Scraper):
         """
         try:
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
+            self.limiter.wait()
             response = self.session.get(url)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
@@ -123,7 +167,7 @@ class BaytScraper(Scraper):
         location_tag = job.find("div", class_="t-mute t-small")
         location = location_tag.get_text(strip=True) if location_tag else None
 
-        job_id = f"bayt-{abs(hash(job_url))}"
+        job_id = self._get_job_id(job_url)
         location_obj = Location(
             city=location,
             country=Country.from_string(self.country),
@@ -143,3 +187,50 @@ class BaytScraper(Scraper):
         a_tag = job_general_information.find("a")
         if a_tag and a_tag.has_attr("href"):
             return self.base_url + a_tag["href"].strip()
+
+    @staticmethod
+    def _get_job_id(job_url: str) -> str:
+        """
+        Uses the numeric id at the end of the Bayt URL slug
+        (e.g. /en/uae/jobs/python-developer-5012345/), falling back to a stable digest
+        """
+        match = re.search(r"-(\d+)$", urlsplit(canonicalize_url(job_url)).path)
+        if match:
+            return f"bayt-{match.group(1)}"
+        return stable_job_id("bayt", job_url)
+
+    def _add_descriptions(self, job_list: list[JobPost]) -> None:
+        """
+        Fetches the job pages concurrently and fills in description and emails
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            descriptions = executor.map(
+                lambda job_post: self._get_description(job_post.job_url), job_list
+            )
+            for job_post, description in zip(job_list, descriptions):
+                job_post.description = description
+                job_post.emails = extract_emails_from_text(description)
+
+    def _get_description(self, job_url: str) -> str | None:
+        """
+        Retrieves the job description from the job page
+        """
+        try:
+            self.limiter.wait()
+            response = self.session.get(job_url, timeout=10)
+            response.raise_for_status()
+        except Exception as e:
+            log.error(f"Bayt: Error fetching job page - {str(e)}")
+            return None
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        div_content = soup.find("div", class_="t-break")
+        if div_content is None:
+            return None
+        div_content = remove_attributes(div_content)
+        description = div_content.prettify(formatter="html")
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            description = markdown_converter(description)
+        elif self.scraper_input.description_format == DescriptionFormat.PLAIN:
+            description = plain_converter(description)
+        return description
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
@@ -16,6 +17,7 @@ from jobspy.bdjobs.util import (
     parse_location,
     parse_date,
     find_job_listings,
+    parse_job_card,
     is_job_remote,
 )
 from jobspy.model import (
@@ -34,6 +36,9 @@ from jobspy.util import (
     create_logger,
     remove_attributes,
     markdown_converter,
+    get_enum_from_job_type,
+    stable_job_id,
+    RateLimiter,
 )
 
 log = create_logger("BDJobs")
@@ -44,14 +49,23 @@ class BDJobs(Scraper):
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
     delay = 2
     band_delay = 3
+    detail_timeout = 20
+    max_workers = 5
+    # spaces detail page requests across all BDJobs workers in the process
+    limiter = RateLimiter(0.2, 0.3)
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
         """
-        super().__init__(Site.BDJOBS, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.BDJOBS, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -61,6 +75,8 @@ class BDJobs(Scraper):
             clear_cookies=True,
         )
         self.session.headers.update(headers)
+        if self.user_agent:
+            self.session.headers["User-Agent"] = self.user_agent
         self.scraper_input = None
         self.country = "bangladesh"
 
@@ -110,18 +126,28 @@ class BDJobs(Scraper):
 
                 log.info(f"Found {len(job_cards)} job cards on page {page}")
 
+                page_jobs: list[JobPost] = []
                 for job_card in job_cards:
                     try:
                         job_post = self._process_job(job_card)
                         if job_post and job_post.id not in seen_ids:
                             seen_ids.add(job_post.id)
-                            job_list.append(job_post)
+                            page_jobs.append(job_post)
 
-                            if not continue_search():
+                            if (
+                                len(job_list) + len(page_jobs)
+                                >= scraper_input.results_wanted
+                            ):
                                 break
                     except Exception as e:
                         log.error(f"Error processing job card: {str(e)}")
 
+                if scraper_input.bdjobs_fetch_description:
+                    self._add_job_details(page_jobs)
+                job_list.extend(page_jobs)
+
+                if not continue_search():
+                    break
                 page += 1
                 # Add delay between requests
                 time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
@@ -135,13 +161,13 @@ class BDJobs(Scraper):
 
     def _process_job(self, job_card: Tag) -> Optional[JobPost]:
         """
-        Processes a job card element into a JobPost object
+        Processes a job card element into a JobPost object (without details)
         :param job_card: Job card element
         :return: JobPost object
         """
         try:
-            # Extract job ID and URL
-            job_link = job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
+            card = parse_job_card(job_card)
+            job_link = card.get("link")
             if not job_link:
                 return None
 
@@ -153,101 +179,59 @@ class BDJobs(Scraper):
             job_id = (
                 job_url.split("jobid=")[-1].split("&")[0]
                 if "jobid=" in job_url
-                else f"bdjobs-{hash(job_url)}"
+                else stable_job_id("bdjobs", job_url)
             )
 
-            # Extract title
-            title = job_link.get_text(strip=True)
-            if not title:
-                title_elem = job_card.find(
-                    ["h2", "h3", "h4", "strong", "div"],
-                    class_=lambda c: c and "job-title-text" in c,
-                )
-                title = title_elem.get_text(strip=True) if title_elem else "N/A"
-
-            # Extract company name - IMPROVED
-            company_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c and "comp-name-text" in (c or "").lower(),
-            )
-            if company_elem:
-                company_name = company_elem.get_text(strip=True)
-            else:
-                # Try alternative selectors
-                company_elem = job_card.find(
-                    ["span", "div"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["company", "org", "comp-name"]
-                    ),
-                )
-                company_name = (
-                    company_elem.get_text(strip=True) if company_elem else "N/A"
-                )
-
-            # Extract location
-            location_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c and "locon-text-d" in (c or "").lower(),
-            )
-            if not location_elem:
-                location_elem = job_card.find(
-                    ["span", "div"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["location", "area", "locon"]
-                    ),
-                )
+            title = job_link.get_text(strip=True) or card.get("title") or "N/A"
+            company_name = card.get("company") or card.get("company_fallback") or "N/A"
             location_text = (
-                location_elem.get_text(strip=True)
-                if location_elem
-                else "Dhaka, Bangladesh"
+                card.get("location")
+                or card.get("location_fallback")
+                or "Dhaka, Bangladesh"
             )
-
-            # Create Location object
             location = parse_location(location_text, self.country)
 
-            # Extract date posted
-            date_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c
-                and any(
-                    term in (c or "").lower()
-                    for term in ["date", "deadline", "published"]
-                ),
-            )
-            date_posted = None
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                date_posted = parse_date(date_text)
+            date_posted = parse_date(card["date"]) if card.get("date") else None
 
             # Check if job is remote
             is_remote = is_job_remote(title, location=location)
 
-            # Create job post object
-            job_post = JobPost(
+            return JobPost(
                 id=job_id,
                 title=title,
-                company_name=company_name,  # Use company_name instead of company
+                company_name=company_name,
                 location=location,
                 date_posted=date_posted,
                 job_url=job_url,
                 is_remote=is_remote,
-                site=self.site,
             )
-
-            # Always fetch description for BDJobs
-            job_details = self._get_job_details(job_url)
-            job_post.description = job_details.get("description", "")
-            job_post.job_type = job_details.get("job_type", "")
-
-            return job_post
         except Exception as e:
             log.error(f"Error in _process_job: {str(e)}")
             return None
 
+    def _add_job_details(self, job_posts: list[JobPost]) -> None:
+        """
+        Fetches the detail pages for job_posts concurrently and fills in
+        description, job type and industry
+        :param job_posts: JobPost objects from one search page
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            details = executor.map(
+                lambda job_post: self._get_job_details(job_post.job_url), job_posts
+            )
+            for job_post, job_details in zip(job_posts, details):
+                job_post.description = job_details.get("description")
+                job_type = job_details.get("job_type")
+                job_type = (
+                    get_enum_from_job_type(
+                        job_type.lower().replace(" ", "").replace("-", "")
+                    )
+                    if job_type
+                    else None
+                )
+                job_post.job_type = [job_type] if job_type else None
+                job_post.company_industry = job_details.get("company_industry")
+
     def _get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
         Gets detailed job information from the job page
@@ -255,7 +239,8 @@ class BDJobs(Scraper):
         :return: Dictionary with job details
         """
         try:
-            response = self.session.get(job_url, timeout=60)
+            self.limiter.wait()
+            response = self.session.get(job_url, timeout=self.detail_timeout)
             if response.status_code != 200:
                 return {}
 
@@ -22,6 +22,16 @@ job_selectors = [
     "div.featured-wrap",     # Catches featured job listings
 ]
 
+# Job card fields: (tag names, class substrings), first match in document order wins
+card_fields = {
+    "title": (("h2", "h3", "h4", "strong", "div"), ("job-title-text",)),
+    "company": (("span", "div"), ("comp-name-text",)),
+    "company_fallback": (("span", "div"), ("company", "org", "comp-name")),
+    "location": (("span", "div"), ("locon-text-d",)),
+    "location_fallback": (("span", "div"), ("location", "area", "locon")),
+    "date": (("span", "div"), ("date", "deadline", "published")),
+}
+
 # Date formats used by BDJobs
 date_formats = [
     "%d %b %Y",
@@ -79,6 +79,34 @@ def find_job_listings(soup: BeautifulSoup) -> List[Any]:
     return []
 
 
+def parse_job_card(job_card: Any) -> Dict[str, Any]:
+    """
+    Extracts the job link and card fields in a single pass over the card
+    :param job_card: Job card element
+    :return: Dictionary with the link tag and the text of each field found
+    """
+    from .constant import card_fields
+
+    card = {}
+    for tag in job_card.find_all(["a", "span", "div", "h2", "h3", "h4", "strong"]):
+        if tag.name == "a":
+            href = tag.get("href")
+            if "link" not in card and href and "jobdetail" in href.lower():
+                card["link"] = tag
+            continue
+        classes = " ".join(tag.get("class") or []).lower()
+        if not classes:
+            continue
+        for field, (tag_names, terms) in card_fields.items():
+            if (
+                field not in card
+                and tag.name in tag_names
+                and any(term in classes for term in terms)
+            ):
+                card[field] = tag.get_text(strip=True)
+    return card
+
+
 def is_job_remote(title: str, description: str = None, location: Location = None) -> bool:
     """
     Determines if a job is remote based on title, description, and location
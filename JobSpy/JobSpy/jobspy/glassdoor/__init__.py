@@ -79,13 +79,20 @@ class Glassdoor(Scraper):
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
-        tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
-        range_end = min(tot_pages, self.max_pages + 1)
+        # the offset can fall inside the first page; skip the rows before it
+        skip = scraper_input.offset % self.jobs_per_page
+        tot_pages = (skip + scraper_input.results_wanted) // self.jobs_per_page + 1
+        range_end = min(range_start + tot_pages, self.max_pages + 1)
         for page in range(range_start, range_end):
             log.info(f"search page: {page} / {range_end - 1}")
             try:
                 jobs, cursor = self._fetch_jobs_page(
-                    scraper_input, location_id, location_type, page, cursor
+                    scraper_input,
+                    location_id,
+                    location_type,
+                    page,
+                    cursor,
+                    skip if page == range_start else 0,
                 )
                 job_list.extend(jobs)
                 if not jobs or len(job_list) >= scraper_input.results_wanted:
@@ -103,9 +110,11 @@ class Glassdoor(Scraper):
         location_type: str,
         page_num: int,
         cursor: str | None,
+        skip: int = 0,
     ) -> Tuple[list[JobPost], str | None]:
         """
-        Scrapes a page of Glassdoor for jobs with scraper_input criteria
+        Scrapes a page of Glassdoor for jobs with scraper_input criteria,
+        leaving out the first skip listings
         """
         jobs = []
         self.scraper_input = scraper_input
@@ -131,7 +140,7 @@ class Glassdoor(Scraper):
             log.error(f"Glassdoor: {str(e)}")
             return jobs, None
 
-        jobs_data = res_json["data"]["jobListings"]["jobListings"]
+        jobs_data = res_json["data"]["jobListings"]["jobListings"][skip:]
 
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
             future_to_job_data = {
@@ -16,7 +16,12 @@ from jobspy.model import (
     Location,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
+from jobspy.util import (
+    extract_emails_from_text,
+    extract_job_type,
+    create_session,
+    stable_job_id,
+)
 from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 
@@ -186,7 +191,7 @@ class Google(Scraper):
         description = job_info[19]
 
         job_post = JobPost(
-            id=f"go-{job_info[28]}",
+            id=f"go-{job_info[28]}" if job_info[28] else stable_job_id("go", job_url),
             title=title,
             company_name=company_name,
             location=Location(
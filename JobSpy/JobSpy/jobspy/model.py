@@ -314,6 +314,9 @@ class ScraperInput(BaseModel):
     offset: int = 0
     linkedin_fetch_description: bool = False
     linkedin_company_ids: list[int] | None = None
+    naukri_fetch_description: bool = False
+    bdjobs_fetch_description: bool = True
+    bayt_fetch_description: bool = False
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
     request_timeout: int = 60
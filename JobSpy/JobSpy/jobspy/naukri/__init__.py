@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import math
-import random
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Optional
 
@@ -33,18 +32,27 @@ from jobspy.util import (
     markdown_converter,
     create_session,
     create_logger,
+    RateLimiter,
 )
 
 log = create_logger("Naukri")
 
+
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
     delay = 3
     band_delay = 4
-    jobs_per_page = 20  
+    jobs_per_page = 20
+    max_pages = 50
+    max_workers = 4
+    # shared by every Naukri scraper and worker thread in the process
+    limiter = RateLimiter(delay, band_delay)
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
     ):
         """
         Initializes NaukriScraper with the Naukri API URL
@@ -60,12 +68,13 @@ class Naukri(Scraper):
         )
         self.session.headers.update(naukri_headers)
         self.scraper_input = None
-        self.country = "India"  #naukri is india-focused by default
+        self.country = "India"  # naukri is india-focused by default
         log.info("Naukri scraper initialized")
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
-        Scrapes Naukri API for jobs with scraper_input criteria
+        Scrapes Naukri API for jobs with scraper_input criteria. The first page
+        reports the total job count, the remaining pages are fetched concurrently
         :param scraper_input:
         :return: job_response
         """
@@ -73,82 +82,118 @@ class Naukri(Scraper):
         job_list: list[JobPost] = []
         seen_ids = set()
         start = scraper_input.offset or 0
-        page = (start // self.jobs_per_page) + 1
-        request_count = 0
+        first_page = (start // self.jobs_per_page) + 1
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
-        continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+
+        log.info(
+            f"Scraping page {first_page} for search term: {scraper_input.search_term}"
         )
+        data = self._fetch_page(first_page, seconds_old)
+        if not data:
+            return JobResponse(jobs=job_list)
+        # the offset can fall inside the first page; skip the rows before it
+        first_rows = data.get("jobDetails", [])[start % self.jobs_per_page :]
+        self._add_jobs(first_rows, job_list, seen_ids)
 
-        while continue_search():
-            request_count += 1
+        total_jobs = data.get("noOfJobs") or 0
+        last_page = min(math.ceil(total_jobs / self.jobs_per_page), self.max_pages)
+        log.info(f"Naukri reports {total_jobs} jobs across {last_page} pages")
+        next_page = first_page + 1
+
+        while len(job_list) < scraper_input.results_wanted and next_page <= last_page:
+            pages_short = math.ceil(
+                (scraper_input.results_wanted - len(job_list)) / self.jobs_per_page
+            )
+            pages = list(range(next_page, min(next_page + pages_short, last_page + 1)))
+            next_page = pages[-1] + 1
             log.info(
-                f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
+                f"Scraping pages {pages[0]}-{pages[-1]} / {last_page} "
                 f"for search term: {scraper_input.search_term}"
             )
-            params = {
-                "noOfResults": self.jobs_per_page,
-                "urlType": "search_by_keyword",
-                "searchType": "adv",
-                "keyword": scraper_input.search_term,
-                "pageNo": page,
-                "k": scraper_input.search_term,
-                "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
-                "src": "jobsearchDesk",
-                "latLong": "",
-                "location": scraper_input.location,
-                "remote": "true" if scraper_input.is_remote else None,
-            }
-            if seconds_old:
-                params["days"] = seconds_old // 86400  # Convert to days
-
-            params = {k: v for k, v in params.items() if v is not None}
-            try:
-                log.debug(f"Sending request to {self.base_url} with params: {params}")
-                response = self.session.get(self.base_url, params=params, timeout=10)
-                if response.status_code not in range(200, 400):
-                    err = f"Naukri API response status code {response.status_code} - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
-                data = response.json()
-                job_details = data.get("jobDetails", [])
-                log.info(f"Received {len(job_details)} job entries from API")
-                if not job_details:
-                    log.warning("No job details found in API response")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(
+                    executor.map(lambda p: self._fetch_page(p, seconds_old), pages)
+                )
+
+            # merge in page order on this thread so seen_ids needs no locking
+            for data in results:
+                if not data or not data.get("jobDetails"):
+                    next_page = last_page + 1
                     break
-            except Exception as e:
-                log.error(f"Naukri API request failed: {str(e)}")
-                return JobResponse(jobs=job_list)
-
-            for job in job_details:
-                job_id = job.get("jobId")
-                if not job_id or job_id in seen_ids:
-                    continue
-                seen_ids.add(job_id)
-                log.debug(f"Processing job ID: {job_id}")
-
-                try:
-                    fetch_desc = scraper_input.linkedin_fetch_description
-                    job_post = self._process_job(job, job_id, fetch_desc)
-                    if job_post:
-                        job_list.append(job_post)
-                        log.info(f"Added job: {job_post.title} (ID: {job_id})")
-                    if not continue_search():
-                        break
-                except Exception as e:
-                    log.error(f"Error processing job ID {job_id}: {str(e)}")
-                    raise NaukriException(str(e))
-
-            if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                page += 1
-
-        job_list = job_list[:scraper_input.results_wanted]
+                self._add_jobs(data["jobDetails"], job_list, seen_ids)
+
+        job_list = job_list[: scraper_input.results_wanted]
         log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
         return JobResponse(jobs=job_list)
 
+    def _fetch_page(self, page: int, seconds_old: int | None) -> dict | None:
+        """
+        Fetches one page of search results under the shared rate limiter
+        :return: the API response, or None if the request failed
+        """
+        params = {
+            "noOfResults": self.jobs_per_page,
+            "urlType": "search_by_keyword",
+            "searchType": "adv",
+            "keyword": self.scraper_input.search_term,
+            "pageNo": page,
+            "k": self.scraper_input.search_term,
+            "seoKey": f"{self.scraper_input.search_term.lower().replace(' ', '-')}-jobs",
+            "src": "jobsearchDesk",
+            "latLong": "",
+            "location": self.scraper_input.location,
+            "remote": "true" if self.scraper_input.is_remote else None,
+        }
+        if seconds_old:
+            params["days"] = seconds_old // 86400  # Convert to days
+
+        params = {k: v for k, v in params.items() if v is not None}
+        self.limiter.wait()
+        try:
+            log.debug(f"Sending request to {self.base_url} with params: {params}")
+            response = self.session.get(self.base_url, params=params, timeout=10)
+            if response.status_code not in range(200, 400):
+                err = f"Naukri API response status code {response.status_code} - {response.text}"
+                log.error(err)
+                return None
+            data = response.json()
+            log.info(
+                f"Received {len(data.get('jobDetails', []))} job entries for page {page}"
+            )
+            return data
+        except Exception as e:
+            log.error(f"Naukri API request failed: {str(e)}")
+            return None
+
+    def _add_jobs(
+        self, job_details: list[dict], job_list: list[JobPost], seen_ids: set
+    ) -> None:
+        """
+        Processes a page of job entries, skipping ids already collected
+        """
+        if not job_details:
+            log.warning("No job details found in API response")
+        for job in job_details:
+            if len(job_list) >= self.scraper_input.results_wanted:
+                break
+            job_id = job.get("jobId")
+            if not job_id or job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+            log.debug(f"Processing job ID: {job_id}")
+
+            try:
+                fetch_desc = self.scraper_input.naukri_fetch_description
+                job_post = self._process_job(job, job_id, fetch_desc)
+                if job_post:
+                    job_list.append(job_post)
+                    log.info(f"Added job: {job_post.title} (ID: {job_id})")
+            except Exception as e:
+                log.error(f"Error processing job ID {job_id}: {str(e)}")
+                raise NaukriException(str(e))
+
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
     ) -> Optional[JobPost]:
@@ -157,33 +202,54 @@ class Naukri(Scraper):
         """
         title = job.get("title", "N/A")
         company = job.get("companyName", "N/A")
-        company_url = f"https://www.naukri.com/{job.get('staticUrl', '')}" if job.get("staticUrl") else None
+        company_url = (
+            f"https://www.naukri.com/{job.get('staticUrl', '')}"
+            if job.get("staticUrl")
+            else None
+        )
 
         location = self._get_location(job.get("placeholders", []))
         compensation = self._get_compensation(job.get("placeholders", []))
-        date_posted = self._parse_date(job.get("footerPlaceholderLabel"), job.get("createdDate"))
+        date_posted = self._parse_date(
+            job.get("footerPlaceholderLabel"), job.get("createdDate")
+        )
 
         job_url = f"https://www.naukri.com{job.get('jdURL', f'/job/{job_id}')}"
         raw_description = job.get("jobDescription") if full_descr else None
 
         job_type = parse_job_type(raw_description) if raw_description else None
-        company_industry = parse_company_industry(raw_description) if raw_description else None
+        company_industry = (
+            parse_company_industry(raw_description) if raw_description else None
+        )
 
         description = raw_description
-        if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+        if (
+            description
+            and self.scraper_input.description_format == DescriptionFormat.MARKDOWN
+        ):
             description = markdown_converter(description)
 
         is_remote = is_job_remote(title, description or "", location)
         company_logo = job.get("logoPathV3") or job.get("logoPath")
 
         # Naukri-specific fields
-        skills = job.get("tagsAndSkills", "").split(",") if job.get("tagsAndSkills") else None
+        skills = (
+            job.get("tagsAndSkills", "").split(",")
+            if job.get("tagsAndSkills")
+            else None
+        )
         experience_range = job.get("experienceText")
         ambition_box = job.get("ambitionBoxData", {})
-        company_rating = float(ambition_box.get("AggregateRating")) if ambition_box.get("AggregateRating") else None
+        company_rating = (
+            float(ambition_box.get("AggregateRating"))
+            if ambition_box.get("AggregateRating")
+            else None
+        )
         company_reviews_count = ambition_box.get("ReviewsCount")
         vacancy_count = job.get("vacancy")
-        work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, description or "")
+        work_from_home_type = self._infer_work_from_home_type(
+            job.get("placeholders", []), title, description or ""
+        )
 
         job_post = JobPost(
             id=f"nk-{job_id}",
@@ -238,7 +304,11 @@ class Naukri(Scraper):
                     return None
 
                 # Handle Indian salary formats (e.g., "12-16 Lacs P.A.", "1-5 Cr")
-                salary_match = re.match(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(Lacs|Lakh|Cr)\s*(P\.A\.)?", salary_text, re.IGNORECASE)
+                salary_match = re.match(
+                    r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(Lacs|Lakh|Cr)\s*(P\.A\.)?",
+                    salary_text,
+                    re.IGNORECASE,
+                )
                 if salary_match:
                     min_salary, max_salary, unit = salary_match.groups()[:3]
                     min_salary, max_salary = float(min_salary), float(max_salary)
@@ -270,7 +340,9 @@ class Naukri(Scraper):
         today = datetime.now()
         if not label:
             if created_date:
-                return datetime.fromtimestamp(created_date / 1000).date()  # Convert to date
+                return datetime.fromtimestamp(
+                    created_date / 1000
+                ).date()  # Convert to date
             return None
         label = label.lower()
         if "today" in label or "just now" in label or "few hours" in label:
@@ -280,7 +352,7 @@ class Naukri(Scraper):
             match = re.search(r"(\d+)\s*day", label)
             if match:
                 days = int(match.group(1))
-                parsed_date = (today - timedelta(days = days)).date()
+                parsed_date = (today - timedelta(days=days)).date()
                 log.debug(f"Date parsed: {days} days ago -> {parsed_date}")
                 return parsed_date
         elif created_date:
@@ -290,15 +362,29 @@ class Naukri(Scraper):
         log.debug("No date parsed")
         return None
 
-    def _infer_work_from_home_type(self, placeholders: list[dict], title: str, description: str) -> Optional[str]:
+    def _infer_work_from_home_type(
+        self, placeholders: list[dict], title: str, description: str
+    ) -> Optional[str]:
         """
         Infers work-from-home type from job data (e.g., 'Hybrid', 'Remote', 'Work from office')
         """
-        location_str = next((p["label"] for p in placeholders if p["type"] == "location"), "").lower()
-        if "hybrid" in location_str or "hybrid" in title.lower() or "hybrid" in description.lower():
+        location_str = next(
+            (p["label"] for p in placeholders if p["type"] == "location"), ""
+        ).lower()
+        if (
+            "hybrid" in location_str
+            or "hybrid" in title.lower()
+            or "hybrid" in description.lower()
+        ):
             return "Hybrid"
-        elif "remote" in location_str or "remote" in title.lower() or "remote" in description.lower():
+        elif (
+            "remote" in location_str
+            or "remote" in title.lower()
+            or "remote" in description.lower()
+        ):
             return "Remote"
-        elif "work from office" in description.lower() or not ("remote" in description.lower() or "hybrid" in description.lower()):
+        elif "work from office" in description.lower() or not (
+            "remote" in description.lower() or "hybrid" in description.lower()
+        ):
             return "Work from office"
-        return None
\ No newline at end of file
+        return None
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import random
 import re
+import threading
+import time
 from itertools import cycle
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import numpy as np
+import pandas as pd
 import requests
 import tls_client
 import urllib3
@@ -103,6 +109,29 @@ class TLSRotating(RotatingProxySession, tls_client.Session):
         return response
 
 
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces out request starts by a random interval in
+    [delay, delay + band_delay]. Shared by every worker fetching from one site.
+    """
+
+    def __init__(self, delay: float = 0, band_delay: float = 0):
+        self.delay = delay
+        self.band_delay = band_delay
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + random.uniform(
+                self.delay, self.delay + self.band_delay
+            )
+        if slot > now:
+            time.sleep(slot - now)
+
+
 def create_session(
     *,
     proxies: dict | str | None = None,
@@ -301,6 +330,41 @@ def map_str_to_site(site_name: str) -> Site:
     return Site[site_name.upper()]
 
 
+# query parameters that only track the click and never identify the job
+tracking_params = ("utm_", "gclid", "fbclid", "trk", "refid", "trackingid")
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalizes a job url so the same posting always maps to the same string:
+    lowercase scheme/host, no default port, fragment or tracking params,
+    sorted query and no trailing slash
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rpartition(":")[2]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rpartition(":")[0]
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(tracking_params)
+        )
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def stable_job_id(prefix: str, job_url: str) -> str:
+    """
+    Builds a job id from a 64-bit blake2b digest of the canonical url. Unlike
+    hash() it is identical across processes, so it can key caches and dedup
+    """
+    digest = hashlib.blake2b(canonicalize_url(job_url).encode(), digest_size=8)
+    return f"{prefix}-{digest.hexdigest()}"
+
+
 def get_enum_from_value(value_str):
     for job_type in JobType:
         if value_str in job_type.value:
@@ -361,3 +425,35 @@ desired_order = [
     "vacancy_count",
     "work_from_home_type",
 ]
+
+
+# low-cardinality columns stored as pandas category dtype when compact_dtypes is set
+categorical_columns = [
+    "site",
+    "job_type",
+    "interval",
+    "currency",
+    "salary_source",
+    "job_level",
+    "listing_type",
+    "work_from_home_type",
+    "company_industry",
+]
+
+
+def compact_job_dtypes(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the result columns to compact dtypes: enum-like strings become
+    categories, date_posted becomes datetime64 and salary amounts nullable floats.
+    """
+    jobs_df = jobs_df.astype(
+        {column: "category" for column in categorical_columns if column in jobs_df}
+    )
+    if "date_posted" in jobs_df:
+        jobs_df["date_posted"] = pd.to_datetime(jobs_df["date_posted"], errors="coerce")
+    for column in ("min_amount", "max_amount"):
+        if column in jobs_df:
+            jobs_df[column] = pd.to_numeric(jobs_df[column], errors="coerce").astype(
+                "Float64"
+            )
+    return jobs_df
@@ -0,0 +1,312 @@
+"""Bounded, TTL-aware job cache for the job search API.
+
+JobCache is the thread-safe front used by app.py. Entries live in one of
+three pluggable backends:
+
+- MemoryBackend: in-process LRU bounded by entry count and approximate bytes
+- SQLiteBackend: a local SQLite file, LRU-evicted with the same bounds
+- RedisBackend: any Redis-compatible server (LocalRedis stands in for tests)
+
+Expired entries are dropped on read and by a background sweeper thread.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+def estimate_size(value):
+    """Approximate in-memory size of a JSON-like value in bytes"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class MemoryBackend:
+    """In-process LRU cache bounded by entry count and approximate memory"""
+
+    def __init__(self, max_entries=500, max_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()  # key -> (expires_at, size, value)
+
+    def get(self, key):
+        item = self.entries.get(key)
+        if item is None:
+            return None
+        expires_at, _, value = item
+        if expires_at <= time.time():
+            self.delete(key)
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl):
+        self.delete(key)
+        size = estimate_size(value)
+        self.entries[key] = (time.time() + ttl, size, value)
+        self.total_bytes += size
+        while self.entries and (
+            len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            oldest = next(iter(self.entries))
+            self.delete(oldest)
+
+    def delete(self, key):
+        item = self.entries.pop(key, None)
+        if item is not None:
+            self.total_bytes -= item[1]
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def sweep(self):
+        now = time.time()
+        expired = [key for key, item in self.entries.items() if item[0] <= now]
+        for key in expired:
+            self.delete(key)
+        return len(expired)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SQLiteBackend:
+    """SQLite file cache, LRU-evicted by last access time"""
+
+    def __init__(self, path="job_cache.sqlite3", max_entries=5000, max_bytes=1024**3):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS job_cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS job_cache_accessed ON job_cache (accessed_at)"
+        )
+        self.conn.commit()
+
+    def get(self, key):
+        now = time.time()
+        row = self.conn.execute(
+            "SELECT value, expires_at FROM job_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[1] <= now:
+            self.delete(key)
+            return None
+        self.conn.execute(
+            "UPDATE job_cache SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        self.conn.commit()
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        blob = json.dumps(value).encode()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO job_cache VALUES (?, ?, ?, ?, ?)",
+            (key, blob, len(blob), now + ttl, now),
+        )
+        self._evict()
+        self.conn.commit()
+
+    def _evict(self):
+        count, total = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM job_cache"
+        ).fetchone()
+        rows = self.conn.execute(
+            "SELECT key, size FROM job_cache ORDER BY accessed_at"
+        )
+        evicted = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            total -= size
+        self.conn.executemany("DELETE FROM job_cache WHERE key = ?", evicted)
+
+    def delete(self, key):
+        self.conn.execute("DELETE FROM job_cache WHERE key = ?", (key,))
+        self.conn.commit()
+
+    def clear(self):
+        self.conn.execute("DELETE FROM job_cache")
+        self.conn.commit()
+
+    def sweep(self):
+        cursor = self.conn.execute(
+            "DELETE FROM job_cache WHERE expires_at <= ?", (time.time(),)
+        )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM job_cache").fetchone()[0]
+
+
+class LocalRedis:
+    """In-process stand-in for the subset of the redis client RedisBackend uses"""
+
+    def __init__(self):
+        self.data = {}  # key -> (expires_at, value)
+
+    def _live(self, key):
+        item = self.data.get(key)
+        if item is not None and item[0] <= time.time():
+            del self.data[key]
+            return None
+        return item
+
+    def get(self, name):
+        item = self._live(name)
+        return item[1] if item else None
+
+    def set(self, name, value, ex=None):
+        expires_at = time.time() + ex if ex else float("inf")
+        self.data[name] = (expires_at, value if isinstance(value, bytes) else value.encode())
+        return True
+
+    def delete(self, *names):
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match=None):
+        prefix = match.rstrip("*") if match else ""
+        for key in list(self.data):
+            if key.startswith(prefix) and self._live(key):
+                yield key
+
+
+class RedisBackend:
+    """Redis-compatible cache; TTL and LRU eviction are left to the server"""
+
+    def __init__(self, client=None, url="redis://localhost:6379/0", prefix="job_cache:"):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, json.dumps(value), ex=max(1, int(ttl)))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def sweep(self):
+        # the server expires keys on its own
+        return 0
+
+    def __len__(self):
+        return sum(1 for _ in self.client.scan_iter(match=self.prefix + "*"))
+
+
+class JobCache:
+    """Thread-safe cache front with TTL expiry and a background sweeper"""
+
+    def __init__(self, backend, ttl, sweep_interval=60):
+        self.backend = backend
+        self.ttl = ttl
+        self.lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        if sweep_interval:
+            sweeper = threading.Thread(
+                target=self._sweep_forever, args=(sweep_interval,), daemon=True
+            )
+            sweeper.start()
+
+    def get(self, key):
+        with self.lock:
+            value = self.backend.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self.lock:
+            self.backend.set(key, value, self.ttl if ttl is None else ttl)
+
+    def delete(self, key):
+        with self.lock:
+            self.backend.delete(key)
+
+    def clear(self):
+        with self.lock:
+            self.backend.clear()
+
+    def sweep(self):
+        with self.lock:
+            return self.backend.sweep()
+
+    def _sweep_forever(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                removed = self.sweep()
+                if removed:
+                    print(f"🧹 Swept {removed} expired cache entries")
+            except Exception as e:
+                print(f"⚠️ Cache sweep failed: {str(e)}")
+
+    def stats(self):
+        with self.lock:
+            return {
+                "backend": type(self.backend).__name__,
+                "size": len(self.backend),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self):
+        with self.lock:
+            return len(self.backend)
+
+
+def create_cache(ttl, backend=None):
+    """Build a JobCache from the JOB_CACHE_* environment variables"""
+    backend = backend or os.environ.get("JOB_CACHE_BACKEND", "memory")
+    max_entries = int(os.environ.get("JOB_CACHE_MAX_ENTRIES", 500))
+    max_bytes = int(os.environ.get("JOB_CACHE_MAX_MB", 256)) * 1024 * 1024
+    if backend == "memory":
+        store = MemoryBackend(max_entries=max_entries, max_bytes=max_bytes)
+    elif backend == "sqlite":
+        path = os.environ.get("JOB_CACHE_PATH", "job_cache.sqlite3")
+        store = SQLiteBackend(path, max_entries=max_entries, max_bytes=max_bytes)
+    elif backend == "redis":
+        store = RedisBackend(url=os.environ.get("JOB_CACHE_REDIS_URL", "redis://localhost:6379/0"))
+    elif backend == "local-redis":
+        store = RedisBackend(client=LocalRedis())
+    else:
+        raise ValueError(f"Unknown cache backend: {backend}")
+    return JobCache(store, ttl, sweep_interval=int(os.environ.get("JOB_CACHE_SWEEP_SECONDS", 60)))
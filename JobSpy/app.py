@@ -1,18 +1,59 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from jobspy import scrape_jobs
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
 import hashlib
+import os
+import threading
+import json
 import time
-import random
+from concurrent.futures import Future, ThreadPoolExecutor
+from api_cache import create_cache
+from scrape_scheduler import JobRegistry, tiered_scrape
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize responses with orjson, which is much faster on large job lists"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)
 
-# In-memory cache (for production, use Redis)
-job_cache = {}
+# Fields returned for each job by the API
+API_COLUMNS = [
+    "title",
+    "company",
+    "location",
+    "salary",
+    "job_url",
+    "description",
+    "date_posted",
+    "site",
+    "job_type",
+]
+
 CACHE_DURATION = 600  # 10 minutes (increased for better efficiency)
+# Stale entries are still served (and refreshed in the background) for this long
+STALE_GRACE = int(os.environ.get("CACHE_STALE_GRACE", 1800))
+# Bounded LRU cache; backend chosen by JOB_CACHE_BACKEND (memory, sqlite, redis)
+job_cache = create_cache(ttl=CACHE_DURATION + STALE_GRACE)
+
+# Worker pool for stale-while-revalidate refreshes
+refresh_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("CACHE_REFRESH_WORKERS", 2))
+)
 
 # Site rotation and fallback strategy
 PRIMARY_SITES = ["linkedin", "indeed", "google"]
@@ -22,6 +63,24 @@ BACKUP_SITES = ["bayt", "bdjobs"]
 # Rate limiting per site (to avoid token exhaustion)
 site_last_used = {}
 SITE_COOLDOWN = 60  # 1 minute cooldown between requests per site
+SITE_TIER_TIMEOUT = 8  # seconds before slow sites trigger the next tier
+RESULTS_PER_PAGE = 10
+SITE_PAGE_SIZE = 10  # jobs requested from each site per scrape
+# Only these scrapers seek straight to an offset; the others ignore it or
+# re-walk every earlier page, so they are never resumed
+OFFSET_SITES = {"linkedin", "glassdoor", "naukri"}
+MAX_RESUME_ROUNDS = 3  # scrape rounds per "load more" request
+
+# Hedged requests: race later tiers against slow primaries, stop at N results
+HEDGE_LATENCY_BUDGET = float(os.environ.get("HEDGE_LATENCY_BUDGET", 3))
+HEDGE_MIN_RESULTS = int(os.environ.get("HEDGE_MIN_RESULTS", 10))
+
+# Background scrapes for async /api/jobs requests
+background_jobs = JobRegistry()
+
+# Scrapes currently running, keyed by cache key (single-flight)
+inflight_scrapes = {}
+inflight_lock = threading.Lock()
 
 
 def get_cache_key(search_term, location):
@@ -32,7 +91,16 @@ def get_cache_key(search_term, location):
 
 def is_cache_valid(cache_entry):
     """Check if cache entry is still valid"""
-    return datetime.now() - cache_entry["timestamp"] < timedelta(seconds=CACHE_DURATION)
+    return time.time() - cache_entry["timestamp"] < CACHE_DURATION
+
+
+def schedule_refresh(cache_key, search_term, location):
+    """Refresh a stale cache entry in the background unless a scrape is already running"""
+    with inflight_lock:
+        if cache_key in inflight_scrapes:
+            return
+    print(f"♻️ Serving stale results, refreshing: {search_term} in {location}")
+    refresh_executor.submit(scrape_once, cache_key, search_term, location)
 
 
 def get_available_sites(max_sites=3):
@@ -68,57 +136,261 @@ def get_available_sites(max_sites=3):
     return PRIMARY_SITES[:max_sites] if not available_sites else available_sites
 
 
-def scrape_with_fallback(search_term, location, max_attempts=3):
-    """Scrape jobs with fallback strategy"""
-    jobs_df = pd.DataFrame()
-    attempts = 0
+def get_site_tiers():
+    """Primary, secondary and backup sites that are off cooldown"""
+    current_time = time.time()
+    tiers = [
+        [
+            site
+            for site in tier
+            if current_time - site_last_used.get(site, 0) > SITE_COOLDOWN
+        ]
+        for tier in (PRIMARY_SITES, SECONDARY_SITES, BACKUP_SITES)
+    ]
+    # If no sites available due to cooldown, use primary sites anyway
+    if not any(tiers):
+        tiers[0] = list(PRIMARY_SITES)
+    return tiers
+
+
+def scrape_site(site, search_term, location, offset=0):
+    """Scrape one page worth of jobs from a site, starting at offset"""
+    site_last_used[site] = time.time()
+    return scrape_jobs(
+        site_name=[site],
+        search_term=search_term,
+        location=location or "USA",
+        results_wanted=SITE_PAGE_SIZE,
+        offset=offset,
+        hours_old=168,
+        country_indeed="USA",
+    )
+
+
+def penalize_site(site, error):
+    """Put a site on a longer cooldown when it failed because of rate limiting"""
+    print(f"❌ {site} failed: {str(error)}")
+    if "429" in str(error) or "rate" in str(error).lower():
+        site_last_used[site] = time.time() + 300  # 5 minute penalty
+
+
+def scrape_with_fallback(search_term, location, on_site_done=None, hedge=False):
+    """Scrape jobs with fallback strategy
+
+    Sites are scraped in parallel; secondary and backup sites are launched
+    alongside the primaries once those are slow or come back empty. When
+    hedging, later tiers start after HEDGE_LATENCY_BUDGET seconds and the
+    scrape returns as soon as HEDGE_MIN_RESULTS jobs have arrived.
+    """
+    if hedge:
+        tier_timeout, min_results = HEDGE_LATENCY_BUDGET, HEDGE_MIN_RESULTS
+    else:
+        tier_timeout, min_results = SITE_TIER_TIMEOUT, 1
+    results = tiered_scrape(
+        get_site_tiers(),
+        lambda site: scrape_site(site, search_term, location),
+        tier_timeout=tier_timeout,
+        min_results=min_results,
+        on_site_done=on_site_done,
+        on_site_error=penalize_site,
+        hedge=hedge,
+    )
+    if not results:
+        return pd.DataFrame()
 
-    while jobs_df.empty and attempts < max_attempts:
-        attempts += 1
+    print(f"✅ Success with sites: {list(results)}")
+    return pd.concat(results.values(), ignore_index=True).sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    )
 
-        # Get available sites for this attempt
-        sites_to_try = get_available_sites(
-            max_sites=2 + attempts
-        )  # Increase sites per attempt
 
-        print(f"Attempt {attempts}: Trying sites {sites_to_try}")
+def format_amount(amounts):
+    """Format a numeric salary column as '$50,000' strings"""
+    strings = amounts.astype(object).map(
+        lambda amount: f"${amount:,.0f}", na_action="ignore"
+    )
+    return strings.fillna("")
 
-        try:
-            # Update last used time for selected sites
-            current_time = time.time()
-            for site in sites_to_try:
-                site_last_used[site] = current_time
 
-            # Add random delay to avoid rate limiting
-            time.sleep(random.uniform(1, 3))
+def clean_jobs(jobs_df):
+    """Convert scraped rows into the job dicts returned by the API (column-wise)"""
+    df = jobs_df.reindex(columns=API_COLUMNS + ["min_amount", "max_amount"])
 
-            jobs_df = scrape_jobs(
-                site_name=sites_to_try,
-                search_term=search_term,
-                location=location or "USA",
-                results_wanted=30,  # Reduced to avoid overwhelming APIs
-                hours_old=168,
-                country_indeed="USA" if "indeed" in sites_to_try else None,
-            )
+    # Enhanced data cleaning
+    description = df["description"].fillna("No description available").astype(str)
+    df["description"] = description.where(
+        description.str.len() <= 200, description.str[:200] + "..."
+    )
+
+    # Salary from the scraped amounts
+    min_amount = pd.to_numeric(df["min_amount"], errors="coerce")
+    max_amount = pd.to_numeric(df["max_amount"], errors="coerce")
+    # nullable (Float64) columns give masked masks, which np.select rejects
+    has_min = min_amount.gt(0).to_numpy(bool, na_value=False)
+    has_max = max_amount.gt(0).to_numpy(bool, na_value=False)
+    min_str, max_str = format_amount(min_amount), format_amount(max_amount)
+    df["salary"] = np.select(
+        [has_min & has_max, has_min, has_max],
+        [min_str + "-" + max_str, min_str + "+", "Up to " + max_str],
+        default="N/A",
+    )
+
+    df["date_posted"] = (
+        pd.to_datetime(df["date_posted"], errors="coerce")
+        .dt.strftime("%Y-%m-%d")
+        .fillna("N/A")
+    )
+    df = df[API_COLUMNS].astype(object)
+    df["job_url"] = df["job_url"].fillna("")
+    df = df.where(df.notna(), None)
+    return df.to_dict(orient="records")
+
+
+def single_flight(key, fn, *args, **kwargs):
+    """Run fn once per key at a time; concurrent callers with the same key share its result"""
+    with inflight_lock:
+        future = inflight_scrapes.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            inflight_scrapes[key] = future
+
+    if not is_leader:
+        print(f"⏳ Joining in-flight scrape: {key}")
+        return future.result()
+
+    try:
+        result = fn(*args, **kwargs)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with inflight_lock:
+            inflight_scrapes.pop(key, None)
+
+
+def scrape_once(cache_key, search_term, location, on_progress=None, hedge=False):
+    """Scrape and cache once per cache key; concurrent identical searches wait on the same future"""
 
-            if not jobs_df.empty:
-                print(f"✅ Success with sites: {sites_to_try}")
-                break
+    def scrape():
+        # The previous leader may have filled the cache since our cache check
+        entry = job_cache.get(cache_key)
+        if entry and is_cache_valid(entry):
+            return entry
+        return scrape_and_cache(cache_key, search_term, location, on_progress, hedge)
 
-        except Exception as e:
-            print(f"❌ Attempt {attempts} failed with sites {sites_to_try}: {str(e)}")
+    return single_flight(cache_key, scrape)
 
-            # If specific site fails, mark it with longer cooldown
-            for site in sites_to_try:
-                if "429" in str(e) or "rate" in str(e).lower():
-                    site_last_used[site] = current_time + 300  # 5 minute penalty
 
-            if attempts < max_attempts:
-                wait_time = 2**attempts  # Exponential backoff
-                print(f"⏳ Waiting {wait_time} seconds before retry...")
-                time.sleep(wait_time)
+def scrape_and_cache(cache_key, search_term, location, on_progress=None, hedge=False):
+    """Scrape with fallback, clean the results and cache them
 
-    return jobs_df
+    on_progress(site, jobs) is called with each site's cleaned jobs as it finishes.
+    """
+    print(f"🔍 Cache miss - Scraping for: {search_term} in {location}")
+
+    on_site_done = None
+    if on_progress:
+        on_site_done = lambda site, site_df: on_progress(site, clean_jobs(site_df))
+
+    # Scrape with fallback strategy
+    jobs_df = scrape_with_fallback(
+        search_term, location, on_site_done=on_site_done, hedge=hedge
+    )
+    if jobs_df.empty:
+        return {"jobs": [], "sites": [], "timestamp": time.time()}
+
+    # Convert and clean data
+    jobs_list = clean_jobs(jobs_df)
+    used_sites = jobs_df["site"].unique().tolist() if "site" in jobs_df.columns else []
+    site_counts = jobs_df["site"].value_counts().to_dict()
+
+    # Cache the results with metadata; cursors are the per-site offsets to resume from
+    entry = {
+        "jobs": jobs_list,
+        "sites": used_sites,
+        "timestamp": time.time(),
+        "cursors": {site: int(count) for site, count in site_counts.items()},
+        "exhausted": [s for s, count in site_counts.items() if count < SITE_PAGE_SIZE],
+    }
+    job_cache.set(cache_key, entry)
+
+    print(f"✅ Cached {len(jobs_list)} jobs from sites: {used_sites}")
+    return entry
+
+
+def resumable_sites(entry):
+    """Sites in a cache entry that may still have more jobs upstream"""
+    exhausted = set(entry.get("exhausted", []))
+    return [
+        site
+        for site in entry.get("cursors", {})
+        if site in OFFSET_SITES and site not in exhausted
+    ]
+
+
+def extend_entry(cache_key, search_term, location, needed):
+    """Resume each site from its stored cursor until the cached entry holds `needed` jobs"""
+    entry = job_cache.get(cache_key)
+    if entry is None:
+        return None
+    entry = dict(entry)
+    for _ in range(MAX_RESUME_ROUNDS):
+        if len(entry["jobs"]) >= needed or not resumable_sites(entry):
+            break
+        sites = resumable_sites(entry)
+        cursors = dict(entry["cursors"])
+        print(f"📄 Resuming {sites} for: {search_term} in {location}")
+        results = tiered_scrape(
+            [sites],
+            lambda site: scrape_site(site, search_term, location, cursors[site]),
+            tier_timeout=SITE_TIER_TIMEOUT,
+            on_site_error=penalize_site,
+        )
+
+        seen_urls = {job["job_url"] for job in entry["jobs"]}
+        new_jobs = []
+        exhausted = list(entry.get("exhausted", []))
+        for site in sites:
+            site_df = results.get(site)
+            count = 0 if site_df is None else len(site_df)
+            cursors[site] += count
+            site_jobs = [
+                job
+                for job in (clean_jobs(site_df) if count else [])
+                if job["job_url"] not in seen_urls
+            ]
+            # A short page, or one with nothing new, means the site is done
+            if count < SITE_PAGE_SIZE or not site_jobs:
+                exhausted.append(site)
+            seen_urls.update(job["job_url"] for job in site_jobs)
+            new_jobs += site_jobs
+        entry.update(
+            jobs=entry["jobs"] + new_jobs, cursors=cursors, exhausted=exhausted
+        )
+
+    # A refresh may have replaced the entry while we scraped; keep the newer one
+    current = job_cache.get(cache_key)
+    if current is not None and current["timestamp"] != entry["timestamp"]:
+        return current
+
+    # Keep the original timestamp so staleness still counts from the first scrape
+    age = time.time() - entry["timestamp"]
+    job_cache.set(cache_key, entry, ttl=max(1, CACHE_DURATION + STALE_GRACE - age))
+    return entry
+
+
+def run_scrape_job(job, cache_key, search_term, location, hedge=False):
+    """Background job body: publish each site's jobs as it finishes"""
+    return scrape_once(
+        cache_key,
+        search_term,
+        location,
+        on_progress=lambda site, jobs: job.publish({"site": site, "jobs": jobs}),
+        hedge=hedge,
+    )
 
 
 @app.route("/api/jobs", methods=["POST"])
@@ -128,7 +400,7 @@ def search_jobs():
         search_term = data.get("search_term", "").strip()
         location = data.get("location", "").strip()
         page = data.get("page", 1)
-        results_per_page = 10
+        results_per_page = RESULTS_PER_PAGE
 
         # Validate inputs
         if not search_term:
@@ -138,18 +410,37 @@ def search_jobs():
         cache_key = get_cache_key(search_term, location)
 
         # Check cache first
-        if cache_key in job_cache and is_cache_valid(job_cache[cache_key]):
+        entry = job_cache.get(cache_key)
+        stale = bool(entry) and not is_cache_valid(entry)
+        if entry and not stale:
             print(f"🎯 Cache hit for: {search_term} in {location}")
-            jobs_list = job_cache[cache_key]["jobs"]
-            used_sites = job_cache[cache_key].get("sites", [])
+        elif stale:
+            # Within the grace window: answer now, refresh in the background
+            schedule_refresh(cache_key, search_term, location)
+        elif data.get("async"):
+            # Scrape in the background; the client polls or streams the job
+            job_id = background_jobs.submit(
+                run_scrape_job,
+                cache_key,
+                search_term,
+                location,
+                data.get("hedge", False),
+            )
+            return jsonify(
+                {
+                    "job_id": job_id,
+                    "status": "running",
+                    "poll_url": f"/api/jobs/status/{job_id}",
+                    "stream_url": f"/api/jobs/stream/{job_id}",
+                }
+            ), 202
         else:
-            print(f"🔍 Cache miss - Scraping for: {search_term} in {location}")
-
-            # Scrape with fallback strategy
-            jobs_df = scrape_with_fallback(search_term, location)
+            entry = scrape_once(
+                cache_key, search_term, location, hedge=data.get("hedge", False)
+            )
 
             # Check if we got any results
-            if jobs_df.empty:
+            if not entry["jobs"]:
                 return jsonify(
                     {
                         "jobs": [],
@@ -160,54 +451,24 @@ def search_jobs():
                     }
                 )
 
-            # Convert and clean data
-            jobs_list = []
-            used_sites = (
-                jobs_df["site"].unique().tolist() if "site" in jobs_df.columns else []
-            )
-
-            for _, job in jobs_df.iterrows():
-                # Enhanced data cleaning
-                description = str(job.get("description", "No description available"))
-                if len(description) > 200:
-                    description = description[:200] + "..."
-
-                # Better salary handling
-                salary = None
-                if job.get("salary_min") and job.get("salary_max"):
-                    salary = f"${job.get('salary_min')}-${job.get('salary_max')}"
-                elif job.get("salary_min"):
-                    salary = f"${job.get('salary_min')}+"
-                elif job.get("salary_max"):
-                    salary = f"Up to ${job.get('salary_max')}"
-                else:
-                    salary = job.get("salary", "N/A")
-
-                cleaned_job = {
-                    "title": job.get("title", "N/A"),
-                    "company": job.get("company", "N/A"),
-                    "location": job.get("location", "N/A"),
-                    "salary": salary,
-                    "job_url": job.get("job_url", ""),
-                    "description": description,
-                    "date_posted": str(job.get("date_posted", "N/A")),
-                    "site": job.get("site", "N/A"),
-                    "job_type": job.get("job_type", "N/A"),
-                }
-                jobs_list.append(cleaned_job)
-
-            # Cache the results with metadata
-            job_cache[cache_key] = {
-                "jobs": jobs_list,
-                "sites": used_sites,
-                "timestamp": datetime.now(),
-            }
-
-            print(f"✅ Cached {len(jobs_list)} jobs from sites: {used_sites}")
-
-        # Paginate cached results
+        # Paginate cached results, resuming the scrapers if this page is past them
         start_idx = (page - 1) * results_per_page
         end_idx = start_idx + results_per_page
+        if end_idx > len(entry["jobs"]) and resumable_sites(entry):
+            entry = (
+                single_flight(
+                    f"{cache_key}:more",
+                    extend_entry,
+                    cache_key,
+                    search_term,
+                    location,
+                    end_idx,
+                )
+                or entry
+            )
+
+        jobs_list = entry["jobs"]
+        used_sites = entry.get("sites", [])
         page_jobs = jobs_list[start_idx:end_idx]
 
         return jsonify(
@@ -215,15 +476,13 @@ def search_jobs():
                 "jobs": page_jobs,
                 "total": len(jobs_list),
                 "current_page": page,
-                "has_more": end_idx < len(jobs_list),
+                "has_more": end_idx < len(jobs_list) or bool(resumable_sites(entry)),
                 "sources": used_sites,
-                "cached": cache_key in job_cache,
-                "cache_expires_in": CACHE_DURATION
-                - int(
-                    (datetime.now() - job_cache[cache_key]["timestamp"]).total_seconds()
-                )
-                if cache_key in job_cache
-                else 0,
+                "cached": True,
+                "stale": stale,
+                "cache_expires_in": max(
+                    0, CACHE_DURATION - int(time.time() - entry["timestamp"])
+                ),
             }
         )
 
@@ -234,12 +493,66 @@ def search_jobs():
         ), 503
 
 
+@app.route("/api/jobs/status/<job_id>", methods=["GET"])
+def job_status(job_id):
+    job = background_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+
+    page = request.args.get("page", 1, type=int)
+    results_per_page = RESULTS_PER_PAGE
+    if job.status == "done":
+        jobs_list = job.result["jobs"]
+        used_sites = job.result["sites"]
+    else:
+        # Partial results from the sites that have finished so far
+        events = list(job.events)
+        jobs_list = [item for event in events for item in event["jobs"]]
+        used_sites = [event["site"] for event in events]
+
+    start_idx = (page - 1) * results_per_page
+    end_idx = start_idx + results_per_page
+    return jsonify(
+        {
+            "job_id": job_id,
+            "status": job.status,
+            "error": job.error,
+            "jobs": jobs_list[start_idx:end_idx],
+            "total": len(jobs_list),
+            "current_page": page,
+            "has_more": end_idx < len(jobs_list),
+            "sources": used_sites,
+        }
+    )
+
+
+@app.route("/api/jobs/stream/<job_id>", methods=["GET"])
+def job_stream(job_id):
+    job = background_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job id"}), 404
+
+    def generate():
+        # One server-sent event per finished site, then the final status
+        for event in job.iter_events():
+            yield f"event: site\ndata: {json.dumps(event)}\n\n"
+        summary = {
+            "status": job.status,
+            "error": job.error,
+            "total": len(job.result["jobs"]) if job.result else 0,
+        }
+        yield f"event: {job.status}\ndata: {json.dumps(summary)}\n\n"
+
+    return Response(generate(), mimetype="text/event-stream")
+
+
 @app.route("/api/health", methods=["GET"])
 def health_check():
     return jsonify(
         {
             "status": "API is running",
             "cache_size": len(job_cache),
+            "cache": job_cache.stats(),
             "site_cooldowns": {
                 site: max(0, int(cooldown - time.time()))
                 for site, cooldown in site_last_used.items()
@@ -251,9 +564,8 @@ def health_check():
 
 @app.route("/api/clear-cache", methods=["POST"])
 def clear_cache():
-    global job_cache, site_last_used
-    job_cache = {}
-    site_last_used = {}
+    job_cache.clear()
+    site_last_used.clear()
     return jsonify({"message": "Cache and cooldowns cleared"})
 
 
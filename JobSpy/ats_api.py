@@ -1,21 +1,35 @@
-from flask import Flask, request, jsonify
+# Run under gunicorn with --preload so the model below is loaded once in the
+# master and shared copy-on-write by every forked worker:
+#   gunicorn --preload -w 4 -b 0.0.0.0:5000 ats_api:app
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import os
-import tempfile
 import base64
+import json
+import queue
 import sys
-import os
+import threading
+from jobspy import scrape_jobs
+from scrape_scheduler import tiered_scrape
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from model3 import extract_text_from_file, score_and_rank, generate_score_explanation
-from sentence_transformers import SentenceTransformer
-import pandas as pd
+from model3 import (
+    extract_text_from_file,
+    score_single_resume,
+    generate_score_explanation,
+)
+from embedding_cache import create_encoder
+from job_matching import JobRanker
 
 app = Flask(__name__)
 CORS(app)
 
-# Initialize the model
-model = SentenceTransformer("all-MiniLM-L6-v2")
+# Initialize the model; repeated resumes and job descriptions hit the cache
+model = create_encoder("all-MiniLM-L6-v2")
+
+# Sites scraped in parallel by /api/match-jobs, and jobs requested from each
+MATCH_SITES = os.environ.get("MATCH_JOB_SITES", "indeed,linkedin,google").split(",")
+MATCH_RESULTS_PER_SITE = 20
 
 
 @app.route("/api/get-ats-score", methods=["POST"])
@@ -32,39 +46,22 @@ def get_ats_score():
         if "base64," in pdf_base64:
             pdf_base64 = pdf_base64.split("base64,")[1]
 
-        # Create a temporary file to save the PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
-            temp_pdf.write(base64.b64decode(pdf_base64))
-            temp_pdf_path = temp_pdf.name
-
-        # Extract text from PDF
-        resume_text = extract_text_from_file(temp_pdf_path)
+        # Extract text straight from the decoded bytes; nothing touches disk
+        resume_text = extract_text_from_file(base64.b64decode(pdf_base64))
 
         if not resume_text:
             return jsonify({"error": "Could not extract text from PDF"}), 400
 
-        # Load pre-processed resume database
-        resumes_df = pd.DataFrame()
-        if os.path.exists("resumes_with_vectors1.pkl"):
-            resumes_df = pd.read_pickle("resumes_with_vectors1.pkl")
-
-        # Score the resume
-        user_info = {
-            "text": resume_text,
-            "years_exp": 1,
-        }  # Default to 1 year experience
-        _, user_scores = score_and_rank(
+        # Score the resume on its own; ranking the corpus is not needed here
+        user_scores = score_single_resume(
             job_description,
             3,  # Required years of experience
             [],  # Keywords will be automatically suggested
             model,
-            resumes_df,
-            user_info,
+            resume_text,
+            1,  # Default to 1 year experience
         )
 
-        # Clean up the temporary file
-        os.unlink(temp_pdf_path)
-
         # Return the score and explanation
         return jsonify(
             {
@@ -81,5 +78,84 @@ def get_ats_score():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/match-jobs", methods=["POST"])
+def match_jobs():
+    """
+    Scrape jobs for a search and rank them against the uploaded resume.
+    Streams one server-sent event per site as its jobs are scored, then a
+    final event with every job ranked.
+    """
+    try:
+        data = request.json
+        pdf_base64 = data.get("pdfData")
+        search_term = data.get("search_term", "")
+        location = data.get("location") or "USA"
+
+        if not pdf_base64:
+            return jsonify({"error": "No PDF data provided"}), 400
+        if not search_term:
+            return jsonify({"error": "Search term is required"}), 400
+
+        if "base64," in pdf_base64:
+            pdf_base64 = pdf_base64.split("base64,")[1]
+        resume_text = extract_text_from_file(base64.b64decode(pdf_base64))
+        if not resume_text:
+            return jsonify({"error": "Could not extract text from PDF"}), 400
+
+        ranker = JobRanker(resume_text, model, years_exp=data.get("years_exp", 1))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    finished_sites = queue.Queue()
+
+    def scrape_site(site):
+        return scrape_jobs(
+            site_name=[site],
+            search_term=search_term,
+            location=location,
+            results_wanted=MATCH_RESULTS_PER_SITE,
+            hours_old=168,
+            country_indeed="USA",
+        )
+
+    def scrape():
+        try:
+            tiered_scrape(
+                [MATCH_SITES],
+                scrape_site,
+                on_site_done=lambda site, jobs_df: finished_sites.put((site, jobs_df)),
+                on_site_error=lambda site, e: finished_sites.put((site, e)),
+            )
+        finally:
+            finished_sites.put(None)
+
+    # Scoring happens here as sites finish, never on the scraping threads
+    threading.Thread(target=scrape, daemon=True).start()
+
+    def generate():
+        while True:
+            item = finished_sites.get()
+            if item is None:
+                break
+            site, result = item
+            if isinstance(result, Exception):
+                event = {"site": site, "error": str(result)}
+                yield f"event: site_error\ndata: {json.dumps(event)}\n\n"
+                continue
+            try:
+                jobs = ranker.add_jobs(result)
+            except Exception as e:
+                # One site failing to score must not end the stream
+                event = {"site": site, "error": str(e)}
+                yield f"event: error\ndata: {json.dumps(event)}\n\n"
+                continue
+            event = {"site": site, "jobs": jobs, "top": ranker.top(10)}
+            yield f"event: site\ndata: {json.dumps(event)}\n\n"
+        summary = {"total": len(ranker.scored), "jobs": ranker.top()}
+        yield f"event: done\ndata: {json.dumps(summary)}\n\n"
+
+    return Response(generate(), mimetype="text/event-stream")
+
+
 if __name__ == "__main__":
     app.run(port=5000)
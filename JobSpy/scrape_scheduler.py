@@ -0,0 +1,185 @@
+"""Site scheduling and background scrape jobs for the job search API.
+
+tiered_scrape runs one scrape per site on a shared thread pool, starting
+with the first tier and launching the next tier in parallel whenever the
+running sites are slow or have come back without enough results. In
+hedged mode it returns as soon as enough results have arrived, and runs on
+a separate capped pool so the scrapes it abandons cannot starve other
+requests.
+
+JobRegistry runs a scrape as a background job with an id so request
+threads never block on it; clients poll the job or stream its events.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# One scrape per site runs here, shared by every request
+site_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="site-scrape")
+# Hedged scrapes run here; running scrapes they abandon hold these threads
+# until they finish, never the shared pool's
+hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedged-scrape")
+
+
+def tiered_scrape(
+    tiers,
+    scrape_site,
+    tier_timeout=8,
+    min_results=1,
+    overall_timeout=90,
+    on_site_done=None,
+    on_site_error=None,
+    hedge=False,
+):
+    """
+    Scrape sites tier by tier and return {site: jobs_df} for sites with results.
+
+    The next tier is launched when tier_timeout passes since the last launch
+    without min_results, or as soon as every running site has finished short
+    of min_results. Sites still running at overall_timeout are abandoned.
+    With hedge=True the scrape returns once min_results jobs have arrived
+    from any sites; queued sites are cancelled and running ones abandoned.
+    Hedged scrapes run on hedge_executor, so abandoned ones never hold
+    threads of the shared site_executor.
+    """
+    pending_tiers = [list(tier) for tier in tiers if tier]
+    executor = hedge_executor if hedge else site_executor
+    futures = {}
+    results = {}
+    total = 0
+    start = time.monotonic()
+    last_launch = start
+
+    def launch_next_tier():
+        tier = pending_tiers.pop(0)
+        print(f"🚀 Launching sites {tier}")
+        for site in tier:
+            futures[executor.submit(scrape_site, site)] = site
+
+    launch_next_tier()
+    while futures:
+        now = time.monotonic()
+        if now - start >= overall_timeout:
+            print(f"⌛ Giving up on slow sites {list(futures.values())}")
+            break
+        timeout = overall_timeout - (now - start)
+        if pending_tiers and total < min_results:
+            # Only wake for the tier deadline while another tier could launch
+            timeout = min(timeout, max(0, last_launch + tier_timeout - now))
+        done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            site = futures.pop(future)
+            try:
+                jobs_df = future.result()
+            except Exception as e:
+                if on_site_error:
+                    on_site_error(site, e)
+                continue
+            if jobs_df is not None and not jobs_df.empty:
+                results[site] = jobs_df
+                total += len(jobs_df)
+                if on_site_done:
+                    on_site_done(site, jobs_df)
+
+        short = total < min_results
+        if hedge and not short:
+            if futures:
+                dropped = list(futures.values())
+                print(f"🏁 Enough results, dropping sites {dropped}")
+                for future in futures:
+                    future.cancel()
+            break
+        slow = time.monotonic() - last_launch >= tier_timeout
+        if pending_tiers and short and (slow or not futures):
+            launch_next_tier()
+            last_launch = time.monotonic()
+    return results
+
+
+class JobRegistry:
+    """Background jobs with ids, progress events and a final result"""
+
+    def __init__(self, max_workers=4, ttl=600):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scrape-job"
+        )
+        self.ttl = ttl
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        """Run fn(job, *args, **kwargs) in the background and return the job id"""
+        job = BackgroundJob()
+        with self.lock:
+            self._prune()
+            self.jobs[job.id] = job
+        self.executor.submit(job.run, fn, *args, **kwargs)
+        return job.id
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def _prune(self):
+        cutoff = time.time() - self.ttl
+        expired = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job.finished_at and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+
+class BackgroundJob:
+    """State of one background scrape; readers wait on its condition"""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = "running"
+        self.events = []
+        self.result = None
+        self.error = None
+        self.finished_at = None
+        self.condition = threading.Condition()
+
+    def run(self, fn, *args, **kwargs):
+        try:
+            result = fn(self, *args, **kwargs)
+            self._finish("done", result=result)
+        except Exception as e:
+            self._finish("failed", error=str(e))
+
+    def publish(self, event):
+        with self.condition:
+            self.events.append(event)
+            self.condition.notify_all()
+
+    def _finish(self, status, result=None, error=None):
+        with self.condition:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished_at = time.time()
+            self.condition.notify_all()
+
+    def iter_events(self, timeout=120):
+        """Yield events as they are published until the job finishes"""
+        sent = 0
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.condition:
+                while sent == len(self.events) and self.status == "running":
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    self.condition.wait(remaining)
+                events = self.events[sent:]
+                sent = len(self.events)
+                finished = self.status != "running"
+            yield from events
+            if finished:
+                return
@@ -0,0 +1,163 @@
+"""Inverted-file (IVF) approximate nearest-neighbour index for a ResumeStore.
+
+The normalised vectors are clustered with spherical k-means into n_lists
+lists. A query is compared with the list centroids, and only the rows of
+the nprobe closest lists are scored exactly. Larger nprobe values give
+better recall and slower queries.
+
+The index is saved as three .npy files inside the store directory:
+
+- ivf_centroids.npy: the centroids;
+- ivf_offsets.npy: where each list starts;
+- ivf_rows.npy: the store rows grouped by list.
+
+Run this module directly to benchmark recall and latency against
+brute-force search on a store or on synthetic data:
+
+    python ann_index.py [store_dir]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+FILES = ("ivf_centroids.npy", "ivf_offsets.npy", "ivf_rows.npy")
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _assign(store, centroids, block_size=65536):
+    """Index of the closest centroid of every store row"""
+    assignments = np.empty(len(store), dtype=np.int32)
+    for start in range(0, len(store), block_size):
+        block = _normalize(store.vectors(slice(start, start + block_size)))
+        assignments[start : start + block_size] = np.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+class IVFIndex:
+    """Coarse-quantised index over the rows of a ResumeStore"""
+
+    def __init__(self, centroids, offsets, rows, nprobe=8, candidate_factor=10):
+        self.centroids = centroids
+        self.offsets = offsets
+        self.rows = rows
+        self.nprobe = nprobe
+        # rank_corpus rescores top_k * candidate_factor rows exactly
+        self.candidate_factor = candidate_factor
+
+    @property
+    def n_lists(self):
+        return len(self.centroids)
+
+    @classmethod
+    def build(cls, store, n_lists=None, iterations=10, sample_size=100_000, seed=0):
+        n = len(store)
+        n_lists = n_lists or max(1, int(np.sqrt(n)))
+        n_lists = min(n_lists, n)
+        rng = np.random.default_rng(seed)
+
+        sample_rows = np.sort(rng.choice(n, size=min(n, sample_size), replace=False))
+        sample = _normalize(store.vectors(sample_rows))
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)]
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            empty = np.bincount(assignments, minlength=n_lists) == 0
+            # re-seed empty lists with random sample rows
+            sums[empty] = sample[rng.choice(len(sample), size=empty.sum())]
+            centroids = _normalize(sums)
+
+        assignments = _assign(store, centroids)
+        rows = np.argsort(assignments, kind="stable").astype(np.int64)
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(assignments, minlength=n_lists))
+        return cls(centroids, offsets, rows)
+
+    def save(self, path):
+        for name, array in zip(FILES, (self.centroids, self.offsets, self.rows)):
+            np.save(os.path.join(path, name), array)
+
+    @staticmethod
+    def exists(path):
+        return all(os.path.exists(os.path.join(path, name)) for name in FILES)
+
+    @classmethod
+    def load(cls, path):
+        return cls(*(np.load(os.path.join(path, name), mmap_mode="r") for name in FILES))
+
+    def search(self, store, query_vector, n, nprobe=None):
+        """
+        Approximate top-n store rows by cosine similarity to query_vector.
+        Returns (rows, scores); the scores are exact for the returned rows.
+        """
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        query = _normalize(query_vector)
+        closest = np.argpartition(self.centroids @ query, -nprobe)[-nprobe:]
+        rows = np.sort(
+            np.concatenate([self.rows[self.offsets[i] : self.offsets[i + 1]] for i in closest])
+        )
+        scores = store.cosine(query, rows)
+        if n < len(rows):
+            best = np.argpartition(scores, -n)[-n:]
+            rows, scores = rows[best], scores[best]
+        return rows, scores
+
+
+def benchmark(store, queries, k=10, nprobes=(1, 2, 4, 8, 16, 32)):
+    """Print recall@k and mean latency of the index against brute force"""
+    start = time.perf_counter()
+    exact = [set(np.argpartition(store.cosine(q), -k)[-k:]) for q in queries]
+    brute_ms = (time.perf_counter() - start) * 1000 / len(queries)
+    print(f"brute force: {brute_ms:.2f} ms/query")
+    for nprobe in nprobes:
+        if nprobe > store.index.n_lists:
+            break
+        start = time.perf_counter()
+        found = [store.index.search(store, q, k, nprobe=nprobe)[0] for q in queries]
+        ann_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        recall = np.mean([len(truth & set(rows)) / k for truth, rows in zip(exact, found)])
+        print(
+            f"nprobe={nprobe:<3} recall@{k}={recall:.3f} "
+            f"{ann_ms:.2f} ms/query ({brute_ms / ann_ms:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+
+    from resume_store import ResumeStore
+
+    rng = np.random.default_rng(0)
+    if len(sys.argv) > 1:
+        store = ResumeStore(sys.argv[1])
+        if store.index is None:
+            store.index = IVFIndex.build(store)
+        queries = store.vectors(rng.choice(len(store), size=100)) + rng.normal(
+            0, 0.05, (100, store.dim)
+        )
+    else:
+        # clustered synthetic corpus shaped like MiniLM embeddings
+        n, dim, clusters = 200_000, 384, 500
+        centers = rng.normal(size=(clusters, dim))
+        vectors = centers[rng.integers(clusters, size=n)] + rng.normal(
+            0, 0.6, (n, dim)
+        )
+        path = tempfile.mkdtemp(prefix="ann_bench_")
+        store = ResumeStore.build(path, [""] * n, np.zeros(n), vectors)
+        store.index = IVFIndex.build(store)
+        queries = centers[rng.integers(clusters, size=100)] + rng.normal(
+            0, 0.6, (100, dim)
+        )
+    print(f"{len(store)} rows, {store.index.n_lists} lists")
+    benchmark(store, queries)
+    if len(sys.argv) == 1:
+        shutil.rmtree(path)
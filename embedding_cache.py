@@ -0,0 +1,177 @@
+"""Embedding cache in front of a SentenceTransformer.
+
+CachedEncoder wraps a model and exposes the same encode() call. Vectors are
+keyed by (model name, hash of the whitespace-normalised text) and looked up in
+two tiers:
+
+- an in-process LRU bounded by entry count
+- an optional SQLite file of float32 blobs, shared across restarts and
+  processes
+
+Only texts missing from both tiers reach the model, in one batch.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+
+def normalize_text(text):
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+class SQLiteVectorStore:
+    """key -> float32 vector blobs in a SQLite file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.pid = None
+        self.connection = None
+
+    @property
+    def conn(self):
+        # SQLite connections must not cross a fork (gunicorn --preload), so
+        # every process opens its own
+        if self.pid != os.getpid():
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                """CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL
+                )"""
+            )
+            self.connection.commit()
+            self.pid = os.getpid()
+        return self.connection
+
+    def get_many(self, keys, chunk_size=500):
+        found = {}
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start : start + chunk_size]
+            rows = self.conn.execute(
+                "SELECT key, vector FROM embeddings WHERE key IN (%s)"
+                % ",".join("?" * len(chunk)),
+                chunk,
+            )
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def set_many(self, items):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO embeddings VALUES (?, ?)",
+            [(key, vector.astype(np.float32).tobytes()) for key, vector in items],
+        )
+        self.conn.commit()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+class CachedEncoder:
+    """Drop-in for SentenceTransformer.encode with a two-tier vector cache"""
+
+    def __init__(self, model, model_name, max_entries=10_000, path=None):
+        self.model = model
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.memory = OrderedDict()  # key -> float32 vector
+        self.disk = SQLiteVectorStore(path) if path else None
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, normalized_text):
+        digest = hashlib.sha1(normalized_text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{digest}"
+
+    def encode(self, sentences, batch_size=32, normalize_embeddings=False, **kwargs):
+        """
+        Same contract as SentenceTransformer.encode: one vector for a string,
+        an (n, dim) float32 array for a list. Extra kwargs go to the model on
+        cache misses.
+        """
+        single = isinstance(sentences, str)
+        texts = [normalize_text(t) for t in ([sentences] if single else sentences)]
+        keys = [self.key(t) for t in texts]
+
+        vectors = {}
+        with self.lock:
+            for key in keys:
+                if key in self.memory:
+                    self.memory.move_to_end(key)
+                    vectors[key] = self.memory[key]
+        missing = [key for key in dict.fromkeys(keys) if key not in vectors]
+        if missing and self.disk is not None:
+            with self.lock:
+                found = self.disk.get_many(missing)
+            vectors.update(found)
+            self._remember(found.items())
+            missing = [key for key in missing if key not in found]
+
+        if missing:
+            text_of = dict(zip(keys, texts))
+            kwargs.pop("convert_to_numpy", None)
+            kwargs.setdefault("show_progress_bar", False)
+            encoded = self.model.encode(
+                [text_of[key] for key in missing],
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                **kwargs,
+            )
+            new = list(zip(missing, np.asarray(encoded, dtype=np.float32)))
+            vectors.update(new)
+            self._remember(new)
+            if self.disk is not None:
+                with self.lock:
+                    self.disk.set_many(new)
+
+        with self.lock:
+            self.misses += len(missing)
+            self.hits += len(keys) - len(missing)
+
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        result = np.stack([vectors[key] for key in keys])
+        if normalize_embeddings:
+            norms = np.linalg.norm(result, axis=1, keepdims=True)
+            result = result / np.where(norms == 0, 1, norms)
+        return result[0] if single else result
+
+    def _remember(self, items):
+        with self.lock:
+            for key, vector in items:
+                self.memory[key] = vector
+                self.memory.move_to_end(key)
+            while len(self.memory) > self.max_entries:
+                self.memory.popitem(last=False)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "memory_size": len(self.memory),
+                "disk_size": len(self.disk) if self.disk is not None else None,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def create_encoder(model_name="all-MiniLM-L6-v2", model=None):
+    """Build a CachedEncoder from the EMBEDDING_CACHE_* environment variables"""
+    if model is None:
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(model_name)
+    return CachedEncoder(
+        model,
+        model_name,
+        max_entries=int(os.environ.get("EMBEDDING_CACHE_MAX_ENTRIES", 10_000)),
+        path=os.environ.get("EMBEDDING_CACHE_PATH") or None,
+    )
@@ -0,0 +1,116 @@
+"""Rank scraped jobs for one resume.
+
+JobRanker takes jobspy.scrape_jobs DataFrames as they arrive (for example one
+per site) and scores every job description against a single resume with
+model3's weights:
+
+- descriptions are embedded in one batch per call through the model (a
+  CachedEncoder, so repeated JDs are free)
+- keywords are suggested for all new descriptions with one nlp.pipe pass
+- relevance, keyword and experience scores come from model3.score_matrix
+
+Each job gets the same explanation text the ATS endpoint returns.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from keyword_index import compile_keywords
+from model3 import generate_score_explanation, score_matrix, suggest_keywords_batch
+
+# "5+ years", "3-5 years", "2 yrs" ...; the first figure is the requirement
+YEARS_PATTERN = re.compile(
+    r"(\d{1,2})\s*\+?\s*(?:-|to)?\s*(?:\d{1,2}\s*)?(?:years?|yrs?)\b"
+)
+
+
+def _field(job, key):
+    value = job.get(key)
+    return None if value is None or (np.isscalar(value) and pd.isna(value)) else value
+
+
+def required_years_from_jd(description, default=3):
+    match = YEARS_PATTERN.search(description.lower())
+    return min(int(match.group(1)), 20) if match else default
+
+
+class JobRanker:
+    """Incrementally scores scraped jobs against one resume"""
+
+    def __init__(self, resume_text, model, years_exp=1, default_required_years=3):
+        self.resume_text = resume_text
+        self.model = model
+        self.years_exp = years_exp
+        self.default_required_years = default_required_years
+        self.scored = []
+        self.seen_urls = set()
+
+    def add_jobs(self, jobs_df):
+        """Score the new jobs in jobs_df; returns them best first"""
+        jobs = []
+        for job in jobs_df.to_dict(orient="records"):
+            url = _field(job, "job_url")
+            if url and url in self.seen_urls:
+                continue
+            self.seen_urls.add(url)
+            jobs.append(job)
+        if not jobs:
+            return []
+
+        descriptions = [
+            _field(job, "description") or str(_field(job, "title") or "")
+            for job in jobs
+        ]
+        keywords = suggest_keywords_batch(descriptions)
+        required_years = np.array(
+            [
+                required_years_from_jd(description, self.default_required_years)
+                for description in descriptions
+            ]
+        )
+        scores = score_matrix(
+            descriptions,
+            [self.resume_text],
+            keywords,
+            self.model,
+            required_years=required_years,
+            resume_months=self.years_exp * 12,
+            top_k=1,
+        )
+
+        new = []
+        for i, job in enumerate(jobs):
+            matcher = compile_keywords(tuple(keywords[i]))
+            hits = matcher.hit_matrix([self.resume_text.lower()])[0]
+            details = {
+                "relevance_score": float(scores["relevance_score"][i, 0]),
+                "keyword_score": float(scores["keyword_score"][i, 0]),
+                "experience_score": float(scores["experience_score"][i, 0]),
+                "missing_keywords": matcher.missing(hits),
+                "final_score": float(scores["final_score"][i, 0]),
+            }
+            new.append(
+                {
+                    "title": _field(job, "title"),
+                    "company": _field(job, "company"),
+                    "location": _field(job, "location"),
+                    "job_url": _field(job, "job_url"),
+                    "site": _field(job, "site"),
+                    "score": round(details["final_score"], 1),
+                    "required_years": int(required_years[i]),
+                    "keywords": keywords[i],
+                    "missing_keywords": details["missing_keywords"],
+                    "explanation": generate_score_explanation(
+                        details, self.years_exp * 12, int(required_years[i]) * 12
+                    ),
+                }
+            )
+        new.sort(key=lambda job: job["score"], reverse=True)
+        self.scored.extend(new)
+        return new
+
+    def top(self, n=None):
+        ranked = sorted(self.scored, key=lambda job: job["score"], reverse=True)
+        return ranked if n is None else ranked[:n]
@@ -0,0 +1,265 @@
+"""Keyword matching over many resumes.
+
+KeywordMatcher compiles a keyword set once into a single alternation regex,
+so each text is scanned once no matter how many keywords there are. It
+matches exactly like model3's original per-keyword r"\\bkeyword\\b" search
+on lower-cased text.
+
+TokenIndex is a persistent inverted index from \\w+ tokens to the rows that
+contain them, stored next to a ResumeStore. A keyword can only match rows
+holding all of its tokens, so the posting lists answer single-token
+keywords outright and narrow multi-token ones down to a few rows to check
+with the regex. Posting lists are delta-encoded varints in one file:
+
+- token_vocab.txt: one token per line, in token id order
+- token_offsets.npy: byte offset of each token's postings (plus the end)
+- token_counts.npy: number of rows holding each token
+- token_postings.bin: the varint-encoded row id gaps
+"""
+
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+WORD_CHAR = re.compile(r"\w")
+TOKEN = re.compile(r"\w+")
+TOKEN_FILES = (
+    "token_vocab.txt",
+    "token_offsets.npy",
+    "token_counts.npy",
+    "token_postings.bin",
+)
+
+
+def _is_boundary(text, i):
+    """True if r"\\b" matches between text[i - 1] and text[i]"""
+    before = i > 0 and bool(WORD_CHAR.match(text[i - 1]))
+    after = i < len(text) and bool(WORD_CHAR.match(text[i]))
+    return before != after
+
+
+def _can_overlap(a, b):
+    """True if r"\\ba\\b" and r"\\bb\\b" can match overlapping text"""
+    if len(a) > len(b):
+        a, b = b, a
+    # a inside b, with a's boundaries on boundaries of b; the ends of b see
+    # the same surrounding text for both patterns
+    for start in range(len(b) - len(a) + 1):
+        end = start + len(a)
+        if b.startswith(a, start) and (
+            (start == 0 or _is_boundary(b, start))
+            and (end == len(b) or _is_boundary(b, end))
+        ):
+            return True
+    # a suffix of one is a prefix of the other, split on a boundary in both
+    for first, second in ((a, b), (b, a)):
+        for i in range(1, len(a)):
+            if (
+                first.endswith(second[:i])
+                and _is_boundary(second, i)
+                and _is_boundary(first, len(first) - i)
+            ):
+                return True
+    return False
+
+
+class KeywordMatcher:
+    """One compiled pattern for a keyword set; hits come back as bool matrices"""
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        # unique lower-cased terms; duplicate keywords share a term
+        self.terms = list(dict.fromkeys(keyword.lower() for keyword in self.keywords))
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.columns = np.array(
+            [self.term_index[keyword.lower()] for keyword in self.keywords], dtype=np.intp
+        )
+        alternation = "|".join(
+            re.escape(term) for term in sorted(self.terms, key=len, reverse=True)
+        )
+        self.pattern = re.compile(r"\b(?:" + alternation + r")\b")
+        self.term_patterns = [
+            re.compile(r"\b" + re.escape(term) + r"\b") for term in self.terms
+        ]
+        # One scan reports non-overlapping matches only, so a term that can
+        # overlap another may be hidden by it; those are re-checked alone.
+        self.overlapping = {
+            i: self.term_patterns[i]
+            for i, term in enumerate(self.terms)
+            if any(_can_overlap(term, other) for other in self.terms if other != term)
+        }
+
+    def term_hits(self, text):
+        hits = np.zeros(len(self.terms), dtype=bool)
+        for term in set(self.pattern.findall(text)):
+            hits[self.term_index[term]] = True
+        for i, pattern in self.overlapping.items():
+            if not hits[i] and pattern.search(text):
+                hits[i] = True
+        return hits
+
+    def hit_matrix(self, texts):
+        """(len(texts), len(keywords)) bool matrix of keyword hits per text"""
+        if not self.keywords:
+            return np.zeros((len(texts), 0), dtype=bool)
+        term_hits = np.array([self.term_hits(text) for text in texts], dtype=bool)
+        return term_hits.reshape(-1, len(self.terms))[:, self.columns]
+
+    def scores(self, texts):
+        """Fraction of keywords found in each text (1.0 with no keywords)"""
+        if not self.keywords:
+            return np.ones(len(texts))
+        return self.hit_matrix(texts).mean(axis=1)
+
+    def missing(self, hits):
+        """Keywords not hit in one row of hit_matrix"""
+        return [keyword for keyword, hit in zip(self.keywords, hits) if not hit]
+
+
+@lru_cache(maxsize=256)
+def compile_keywords(keywords):
+    """Cached KeywordMatcher for a tuple of keywords"""
+    return KeywordMatcher(keywords)
+
+
+def varint_lengths(values):
+    """Bytes each non-negative integer takes as a LEB128 varint"""
+    values = np.asarray(values, dtype=np.uint64)
+    nbytes = np.ones(len(values), dtype=np.int64)
+    for shift in (7, 14, 21, 28, 35):
+        nbytes += values >= (1 << shift)
+    return nbytes
+
+
+def encode_varints(values):
+    """LEB128-encode non-negative integers into a uint8 array"""
+    values = np.asarray(values, dtype=np.uint64)
+    nbytes = varint_lengths(values)
+    owner = np.repeat(np.arange(len(values)), nbytes)
+    position = np.arange(nbytes.sum()) - np.repeat(np.cumsum(nbytes) - nbytes, nbytes)
+    out = ((values[owner] >> (7 * position).astype(np.uint64)) & 127).astype(np.uint8)
+    out[position < nbytes[owner] - 1] |= 128
+    return out
+
+
+def decode_varints(data):
+    """Inverse of encode_varints"""
+    data = np.asarray(data, dtype=np.uint8)
+    if not len(data):
+        return np.zeros(0, dtype=np.uint64)
+    last = data < 128
+    starts = np.flatnonzero(np.concatenate(([True], last[:-1])))
+    owner = np.cumsum(np.concatenate(([0], last[:-1])))
+    position = np.arange(len(data)) - starts[owner]
+    parts = (data & 127).astype(np.uint64) << (7 * position).astype(np.uint64)
+    return np.add.reduceat(parts, starts)
+
+
+class TokenIndex:
+    """Token -> sorted row ids, read from compressed posting lists"""
+
+    def __init__(self, vocab, offsets, counts, postings):
+        self.vocab = vocab
+        self.offsets = offsets
+        self.counts = counts
+        self.postings_data = postings
+        self.token_ids = {token: i for i, token in enumerate(vocab)}
+
+    @staticmethod
+    def exists(path):
+        return all(os.path.exists(os.path.join(path, name)) for name in TOKEN_FILES)
+
+    @classmethod
+    def load(cls, path):
+        with open(os.path.join(path, "token_vocab.txt"), encoding="utf-8") as f:
+            vocab = f.read().split("\n") if os.path.getsize(f.name) else []
+        offsets = np.load(os.path.join(path, "token_offsets.npy"))
+        postings_path = os.path.join(path, "token_postings.bin")
+        postings = (
+            np.memmap(postings_path, dtype=np.uint8, mode="r")
+            if offsets[-1]
+            else np.zeros(0, dtype=np.uint8)
+        )
+        counts = np.load(os.path.join(path, "token_counts.npy"))
+        return cls(vocab, offsets, counts, postings)
+
+    @classmethod
+    def build(cls, texts, path, chunk_size=10_000):
+        """Index an iterable of texts (row i is the i-th text) into path"""
+        token_ids = {}
+        ids, rows = [], []
+        chunk_ids, chunk_rows = [], []
+        for row, text in enumerate(texts):
+            for token in set(TOKEN.findall(text)):
+                chunk_ids.append(token_ids.setdefault(token, len(token_ids)))
+                chunk_rows.append(row)
+            if row % chunk_size == chunk_size - 1:
+                # keep pending postings in compact arrays, not Python ints
+                ids.append(np.array(chunk_ids, dtype=np.uint32))
+                rows.append(np.array(chunk_rows, dtype=np.uint32))
+                chunk_ids, chunk_rows = [], []
+        ids = np.concatenate(ids + [np.array(chunk_ids, dtype=np.uint32)])
+        rows = np.concatenate(rows + [np.array(chunk_rows, dtype=np.uint32)])
+
+        # group by token; rows stay ascending within each token
+        order = np.argsort(ids, kind="stable")
+        ids, rows = ids[order], rows[order].astype(np.int64)
+        counts = np.bincount(ids, minlength=len(token_ids)).astype(np.int64)
+        starts = np.cumsum(counts) - counts
+        gaps = np.diff(rows, prepend=0)
+        gaps[starts] = rows[starts]
+        byte_ends = np.concatenate(([0], np.cumsum(varint_lengths(gaps))))
+        offsets = np.append(byte_ends[starts], byte_ends[-1])
+
+        with open(os.path.join(path, "token_vocab.txt"), "w", encoding="utf-8") as f:
+            f.write("\n".join(token_ids))
+        encode_varints(gaps).tofile(os.path.join(path, "token_postings.bin"))
+        np.save(os.path.join(path, "token_counts.npy"), counts)
+        np.save(os.path.join(path, "token_offsets.npy"), offsets)
+        return cls.load(path)
+
+    def postings(self, token):
+        """Sorted rows containing token"""
+        token_id = self.token_ids.get(token)
+        if token_id is None:
+            return np.zeros(0, dtype=np.int64)
+        data = self.postings_data[self.offsets[token_id] : self.offsets[token_id + 1]]
+        return np.cumsum(decode_varints(data)).astype(np.int64)
+
+    def candidate_rows(self, tokens, rows=None):
+        """Rows (among rows, if given) holding every token, rarest first"""
+        if any(token not in self.token_ids for token in tokens):
+            return np.zeros(0, dtype=np.int64)
+        for token in sorted(set(tokens), key=lambda t: self.counts[self.token_ids[t]]):
+            postings = self.postings(token)
+            rows = (
+                postings
+                if rows is None
+                else np.intersect1d(rows, postings, assume_unique=True)
+            )
+            if not len(rows):
+                break
+        return rows
+
+    def hit_matrix(self, matcher, rows, get_text):
+        """Same result as matcher.hit_matrix on the texts of rows"""
+        rows = np.asarray(rows, dtype=np.int64)
+        term_hits = np.zeros((len(rows), len(matcher.terms)), dtype=bool)
+        texts = {}
+        for j, term in enumerate(matcher.terms):
+            tokens = TOKEN.findall(term)
+            if tokens:
+                present = np.isin(rows, self.candidate_rows(tokens, rows))
+            else:
+                present = np.ones(len(rows), dtype=bool)
+            if len(tokens) == 1 and tokens[0] == term:
+                # a single-token keyword matches exactly the rows holding it
+                term_hits[:, j] = present
+                continue
+            for i in np.flatnonzero(present):
+                if rows[i] not in texts:
+                    texts[rows[i]] = get_text(rows[i])
+                term_hits[i, j] = bool(matcher.term_patterns[j].search(texts[rows[i]]))
+        return term_hits[:, matcher.columns]
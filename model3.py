@@ -17,91 +17,161 @@
 import glob
 import pandas as pd
 import numpy as np
-import jsonlines
-import re
 import os
 from datetime import datetime
-from collections import Counter
+from collections import Counter, OrderedDict
+import hashlib
+import threading
 
 # --- NEW: Import spaCy for NLP ---
 import spacy
 
 # Text and File Processing
+import io
 import pdfplumber
 import docx
 
+try:
+    # Optional PDFium backend: much faster than pdfplumber on multi-page PDFs
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# PDFium is not thread-safe; the ATS API extracts uploads on request threads
+_pdfium_lock = threading.Lock()
+
 # Machine Learning
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 
+from embedding_cache import create_encoder
+from keyword_index import compile_keywords
+from resume_ingest import consolidate_db_text, ingest_jsonl
+from resume_store import ResumeStore
+
 
 # --- ⬇️ 1. NEW HELPER FUNCTION FOR KEYWORD SUGGESTION ⬇️ ---
-def suggest_keywords_from_jd(text, top_n=15):
+# List of common non-skill words to ignore
+KEYWORD_STOP_WORDS = {
+    "experience",
+    "Developer",
+    "team",
+    "work",
+    "job",
+    "role",
+    "company",
+    "candidate",
+    "skill",
+    "skills",
+    "requirements",
+    "responsibilities",
+    "knowledge",
+    "ability",
+    "client",
+    "project",
+    "projects",
+    "business",
+    "solution",
+    "solutions",
+    "system",
+    "systems",
+    "data",
+    "product",
+    "products",
+    "development",
+    "management",
+    "analysis",
+    "design",
+    "report",
+    "reports",
+    "service",
+    "services",
+    "application",
+    "applications",
+    "inc",
+}
+
+# Only POS tags are used, so the parser, NER and lemmatizer are never loaded
+SPACY_EXCLUDE = ["parser", "ner", "lemmatizer", "senter"]
+KEYWORD_CACHE_SIZE = 4096
+
+_nlp = None
+_nlp_lock = threading.Lock()
+_keyword_cache = OrderedDict()  # (sha1 of JD, top_n) -> keywords
+_keyword_cache_lock = threading.Lock()
+
+
+def get_nlp():
     """
-    Analyzes job description text to suggest relevant keywords using NLP.
+    Loads the spaCy pipeline once per process, or returns None if the model
+    is not installed.
     """
-    # List of common non-skill words to ignore
-    STOP_WORDS = [
-        "experience",
-        "Developer",
-        "team",
-        "work",
-        "job",
-        "role",
-        "company",
-        "candidate",
-        "skill",
-        "skills",
-        "requirements",
-        "responsibilities",
-        "knowledge",
-        "ability",
-        "client",
-        "project",
-        "projects",
-        "business",
-        "solution",
-        "solutions",
-        "system",
-        "systems",
-        "data",
-        "product",
-        "products",
-        "development",
-        "management",
-        "analysis",
-        "design",
-        "report",
-        "reports",
-        "service",
-        "services",
-        "application",
-        "applications",
-        "inc",
-    ]
-
-    try:
-        # Load the small English model for spaCy
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        print("❌ spaCy model 'en_core_web_sm' not found.")
-        print("➡️ Please run: python -m spacy download en_core_web_sm")
-        return []
-
-    doc = nlp(text)
+    global _nlp
+    with _nlp_lock:
+        if _nlp is None:
+            try:
+                # Load the small English model for spaCy
+                _nlp = spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDE)
+            except OSError:
+                print("❌ spaCy model 'en_core_web_sm' not found.")
+                print("➡️ Please run: python -m spacy download en_core_web_sm")
+                return None
+        return _nlp
+
+
+def _keywords_from_doc(doc, top_n):
     keywords = []
 
     for token in doc:
         # Look for Proper Nouns (like 'Python', 'AWS') and all-caps words (like 'API')
-        if not token.is_stop and token.text.lower() not in STOP_WORDS:
+        if not token.is_stop and token.text.lower() not in KEYWORD_STOP_WORDS:
             if token.pos_ == "PROPN" or (token.is_upper and token.pos_ == "NOUN"):
                 keywords.append(token.text)
 
     # Count frequencies and return the most common ones
-    most_common_keywords = [
-        word for word, count in Counter(keywords).most_common(top_n)
-    ]
-    return most_common_keywords
+    return [word for word, count in Counter(keywords).most_common(top_n)]
+
+
+def _keyword_cache_key(text, top_n):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest(), top_n
+
+
+def suggest_keywords_batch(texts, top_n=15, batch_size=64, n_process=1):
+    """
+    Suggests keywords for many job descriptions at once. Descriptions not
+    seen before are run through nlp.pipe in batches; results are cached
+    by content hash, so repeated descriptions cost nothing.
+    """
+    keys = [_keyword_cache_key(text, top_n) for text in texts]
+    results = {}
+    with _keyword_cache_lock:
+        for key in keys:
+            if key in _keyword_cache:
+                _keyword_cache.move_to_end(key)
+                results[key] = _keyword_cache[key]
+
+    pending = {key: text for key, text in zip(keys, texts) if key not in results}
+    if pending:
+        nlp = get_nlp()
+        if nlp is None:
+            return [[] for _ in texts]
+        # nlp.pipe is lazy; run it to completion before taking the cache lock
+        docs = nlp.pipe(pending.values(), batch_size=batch_size, n_process=n_process)
+        suggested = [_keywords_from_doc(doc, top_n) for doc in docs]
+        with _keyword_cache_lock:
+            for key, keywords in zip(pending, suggested):
+                results[key] = keywords
+                _keyword_cache[key] = keywords
+            while len(_keyword_cache) > KEYWORD_CACHE_SIZE:
+                _keyword_cache.popitem(last=False)
+
+    return [list(results[key]) for key in keys]
+
+
+def suggest_keywords_from_jd(text, top_n=15):
+    """
+    Analyzes job description text to suggest relevant keywords using NLP.
+    """
+    return suggest_keywords_batch([text], top_n=top_n)[0]
 
 
 # --- [All other helper functions (generate_score_explanation, etc.) remain the same] ---
@@ -133,111 +203,367 @@ def generate_score_explanation(scores, candidate_months, required_months):
 def calculate_keyword_score(resume_text, keywords):
     if not keywords:
         return 1.0, []
-    found_count = 0
-    missing = []
-    for keyword in keywords:
-        if re.search(r"\b" + re.escape(keyword.lower()) + r"\b", resume_text):
-            found_count += 1
-        else:
-            missing.append(keyword)
-    return found_count / len(keywords), missing
-
-
-def extract_text_from_file(file_path):
-    print(f"📄 Reading text from '{os.path.basename(file_path)}'...")
-    text = ""
+    matcher = compile_keywords(tuple(keywords))
+    hits = matcher.hit_matrix([resume_text])[0]
+    return float(hits.mean()), matcher.missing(hits)
+
+
+def _file_kind(name, head):
+    """Guess 'pdf', 'docx' or 'text' from a file name, else from its first bytes."""
+    ext = os.path.splitext(name or "")[1].lower()
+    if ext in (".pdf", ".docx"):
+        return ext[1:]
+    if not ext:
+        if head.startswith(b"%PDF"):
+            return "pdf"
+        if head.startswith(b"PK"):
+            return "docx"
+    return "text"
+
+
+def extract_pdf_text(stream):
+    """Extract the text of a PDF from a binary stream, page by page."""
+    if pdfium is not None:
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(stream)
+            try:
+                pages = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+                return "\n".join(pages)
+            finally:
+                pdf.close()
+    with pdfplumber.open(stream) as pdf:
+        return "".join(page.extract_text() or "" for page in pdf.pages)
+
+
+def extract_text_from_file(source, filename=None):
+    """
+    Reads a resume from a path, raw bytes or a binary file-like object.
+    For bytes and streams the type is taken from filename, or sniffed from
+    the content when no filename is given. Nothing is written to disk.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        filename = filename or os.fspath(source)
+    name = os.path.basename(filename) if filename else "uploaded file"
+    print(f"📄 Reading text from '{name}'...")
     try:
-        if file_path.endswith(".pdf"):
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-        elif file_path.endswith(".docx"):
-            doc = docx.Document(file_path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                data = f.read()
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            data = bytes(source)
+        else:
+            data = source.read()
+
+        kind = _file_kind(filename, data[:4])
+        if kind == "pdf":
+            text = extract_pdf_text(io.BytesIO(data))
+        elif kind == "docx":
+            doc = docx.Document(io.BytesIO(data))
+            text = "".join(para.text + "\n" for para in doc.paragraphs)
         else:
-            with open(file_path, "r", encoding="utf-8") as f:
-                text = f.read()
+            text = data.decode("utf-8")
         return text.lower()
     except Exception as e:
-        print(f"Error reading file '{file_path}': {e}")
+        print(f"Error reading file '{name}': {e}")
         return None
 
 
 # (score_and_rank, consolidate_db_text, etc. are unchanged)
-def score_and_rank(
-    job_description, required_years, keywords, model, db_df, user_resume_info=None
-):
-    print("\n--- Scoring All Candidates ---")
+def load_corpus(store_path, legacy_pickle_path=None):
+    """
+    Opens the memory-mapped resume store at store_path (see resume_store.py).
+    If there is none yet but a legacy pickled DataFrame exists, it is
+    converted into a store once. Returns None when neither exists.
+    """
+    if not os.path.exists(os.path.join(store_path, "meta.json")):
+        if not legacy_pickle_path or not os.path.exists(legacy_pickle_path):
+            return None
+        print(f"🔄 Converting '{legacy_pickle_path}' into '{store_path}'...")
+        ResumeStore.from_dataframe(store_path, pd.read_pickle(legacy_pickle_path))
+    return ResumeStore(store_path)
 
-    W_RELEVANCE, W_KEYWORDS, W_EXPERIENCE = 0.50, 0.30, 0.20
 
-    query_vector = model.encode(job_description)
-    db_vectors = np.vstack(db_df["resume_vector"].values)
-    db_df["relevance_score"] = cosine_similarity([query_vector], db_vectors)[0]
+# Corpora at least this large get an IVF index for approximate ranking
+ANN_MIN_ROWS = 50_000
 
-    db_df["keyword_score"] = db_df["resume_text"].apply(
-        lambda x: calculate_keyword_score(x, keywords)[0]
-    )
+# Weights of the three score components (final score is out of 100)
+W_RELEVANCE, W_KEYWORDS, W_EXPERIENCE = 0.50, 0.30, 0.20
 
+
+def score_single_resume(
+    job_description,
+    required_years,
+    keywords,
+    model,
+    resume_text,
+    years_exp,
+    query_vector=None,
+):
+    """
+    Scores one resume against a job description without touching the corpus.
+    Pass query_vector to reuse an already encoded job description.
+    """
+    if query_vector is None:
+        query_vector = model.encode(job_description)
     target_months = required_years * 12
-    db_df["experience_score"] = db_df["total_months_experience"].apply(
-        lambda m: min(m / target_months, 1.0) if target_months > 0 else 1.0
+
+    user_vector = model.encode(resume_text)
+    user_relevance = cosine_similarity([query_vector], [user_vector])[0][0]
+    user_keywords, missing_kws = calculate_keyword_score(resume_text, keywords)
+    user_experience = (
+        min((years_exp * 12) / target_months, 1.0) if target_months > 0 else 1.0
     )
 
-    db_df["final_score"] = (
-        (W_RELEVANCE * db_df["relevance_score"])
-        + (W_KEYWORDS * db_df["keyword_score"])
-        + (W_EXPERIENCE * db_df["experience_score"])
+    user_final_score = (
+        (W_RELEVANCE * user_relevance)
+        + (W_KEYWORDS * user_keywords)
+        + (W_EXPERIENCE * user_experience)
     ) * 100
 
+    return {
+        "relevance_score": user_relevance,
+        "keyword_score": user_keywords,
+        "experience_score": user_experience,
+        "missing_keywords": missing_kws,
+        "final_score": user_final_score,
+    }
+
+
+def rank_corpus(
+    query_vector,
+    required_years,
+    keywords,
+    db_df,
+    db_vectors=None,
+    top_k=None,
+    must_have=None,
+):
+    """
+    Scores every resume in db_df against an encoded job description and returns
+    the rows sorted by final_score. db_df is either a DataFrame, with
+    db_vectors an optional precomputed (n, dim) matrix matching its rows, or a
+    ResumeStore, which is scored straight from its memory-mapped columns.
+
+    Resumes missing any of the must_have keywords are dropped before anything
+    is scored; a store with a token index finds the rest from its postings.
+
+    A store with an IVF index (see ann_index.py) only scores the rows the index
+    retrieves when top_k is given, so ranking is approximate there.
+
+    With top_k, only the best k rows are returned. Relevance and experience are
+    computed for all rows; keyword scoring (the slow part) only runs on rows
+    that can still reach the top k, and selection uses argpartition instead of
+    a full sort.
+    """
+    if isinstance(db_df, ResumeStore):
+        store = db_df
+        allowed = store.rows_with_keywords(must_have) if must_have else None
+        if store.index is not None and top_k is not None:
+            # Approximate retrieval: only the closest rows by relevance are
+            # scored exactly
+            rows, relevance = store.index.search(
+                store, query_vector, top_k * store.index.candidate_factor
+            )
+            if allowed is not None:
+                keep = np.isin(rows, allowed)
+                rows, relevance = rows[keep], relevance[keep]
+        elif allowed is not None:
+            rows = allowed
+            relevance = store.cosine(query_vector, rows)
+        else:
+            rows = np.arange(len(store))
+            relevance = store.cosine(query_vector)
+        if not len(rows):
+            return store.frame(rows)
+        months = store.months[rows].astype(np.float64)
+        keyword_scores = lambda positions: (
+            store.keyword_hits(keywords, rows[positions]).mean(axis=1)
+            if keywords
+            else np.ones(len(positions))
+        )
+        take_rows = lambda positions: store.frame(rows[positions])
+    else:
+        if must_have and not db_df.empty:
+            keep = (
+                compile_keywords(tuple(must_have))
+                .hit_matrix(db_df["resume_text"].tolist())
+                .all(axis=1)
+            )
+            if db_vectors is not None:
+                db_vectors = db_vectors[keep]
+            db_df = db_df[keep]
+        if db_df.empty:
+            return db_df
+        if db_vectors is None:
+            db_vectors = np.vstack(db_df["resume_vector"].values)
+        relevance = cosine_similarity([query_vector], db_vectors)[0]
+        months = db_df["total_months_experience"].to_numpy(dtype=np.float64)
+        texts = db_df["resume_text"].to_numpy()
+        keyword_scores = lambda positions: compile_keywords(tuple(keywords)).scores(
+            texts[positions]
+        )
+        take_rows = lambda rows: db_df.iloc[rows].copy()
+
+    target_months = required_years * 12
+    experience = (
+        np.minimum(months / target_months, 1.0)
+        if target_months > 0
+        else np.ones(len(months))
+    )
+    partial = W_RELEVANCE * relevance + W_EXPERIENCE * experience
+
+    if top_k is not None and top_k < len(months):
+        # A row whose partial score plus the maximum keyword weight is below
+        # the k-th best partial score can never make the top k.
+        kth_best = np.partition(partial, -top_k)[-top_k]
+        candidates = np.flatnonzero(partial + W_KEYWORDS >= kth_best)
+    else:
+        candidates = np.arange(len(months))
+
+    keyword = keyword_scores(candidates)
+    final = (partial[candidates] + W_KEYWORDS * keyword) * 100
+
+    if top_k is not None and top_k < len(candidates):
+        best = np.argpartition(final, -top_k)[-top_k:]
+        candidates, keyword, final = candidates[best], keyword[best], final[best]
+    order = np.argsort(-final, kind="stable")
+    candidates = candidates[order]
+
+    ranked = take_rows(candidates)
+    ranked["relevance_score"] = relevance[candidates]
+    ranked["keyword_score"] = keyword[order]
+    ranked["experience_score"] = experience[candidates]
+    ranked["final_score"] = final[order]
+    return ranked
+
+
+def score_and_rank(
+    job_description,
+    required_years,
+    keywords,
+    model,
+    db_df,
+    user_resume_info=None,
+    db_vectors=None,
+    top_k=None,
+    must_have=None,
+):
+    print("\n--- Scoring All Candidates ---")
+
+    query_vector = model.encode(job_description)
+    ranked_df = rank_corpus(
+        query_vector, required_years, keywords, db_df, db_vectors, top_k, must_have
+    )
+
     user_score_details = None
     if user_resume_info:
-        user_vector = model.encode(user_resume_info["text"])
-        user_relevance = cosine_similarity([query_vector], [user_vector])[0][0]
-        user_keywords, missing_kws = calculate_keyword_score(
-            user_resume_info["text"], keywords
-        )
-        user_experience = (
-            min((user_resume_info["years_exp"] * 12) / target_months, 1.0)
-            if target_months > 0
-            else 1.0
+        user_score_details = score_single_resume(
+            job_description,
+            required_years,
+            keywords,
+            model,
+            user_resume_info["text"],
+            user_resume_info["years_exp"],
+            query_vector=query_vector,
         )
 
-        user_final_score = (
-            (W_RELEVANCE * user_relevance)
-            + (W_KEYWORDS * user_keywords)
-            + (W_EXPERIENCE * user_experience)
-        ) * 100
+    return ranked_df, user_score_details
 
-        user_score_details = {
-            "relevance_score": user_relevance,
-            "keyword_score": user_keywords,
-            "experience_score": user_experience,
-            "missing_keywords": missing_kws,
-            "final_score": user_final_score,
-        }
 
-    return db_df.sort_values(by="final_score", ascending=False), user_score_details
+def _unit_rows(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
 
 
-def consolidate_db_text(row):
-    try:
-        summary = row.get("summary", "") or ""
-        skills_list = []
-        if isinstance(row.get("skills"), dict) and "technical" in row["skills"]:
-            for skill_cat in row["skills"]["technical"].values():
-                if isinstance(skill_cat, list):
-                    skills_list.extend([s.get("name", "") for s in skill_cat])
-        responsibilities = []
-        if isinstance(row.get("experience"), list):
-            for job in row["experience"]:
-                if isinstance(job.get("responsibilities"), list):
-                    responsibilities.extend(job["responsibilities"])
-        full_text = " ".join([summary] + list(set(skills_list)) + responsibilities)
-        return re.sub(r"\s+", " ", full_text).strip().lower()
-    except Exception:
-        return ""
+def score_matrix(
+    jds,
+    resumes,
+    keywords_per_jd,
+    model,
+    required_years=3,
+    resume_months=12,
+    top_k=10,
+    batch_size=64,
+    block_size=256,
+):
+    """
+    Scores every resume against every job description in one go, with the
+    same weights as score_single_resume.
+
+    Both sides are encoded in batches and relevance is one matrix multiply of
+    normalised vectors. Keywords of all JDs are matched in a single pass over
+    each resume. required_years may be one value or one per JD, resume_months
+    one value or one per resume.
+
+    Returns a dict of (len(jds), k) arrays, each row sorted by final_score:
+    indices (into resumes), final_score, relevance_score, keyword_score and
+    experience_score. k is top_k, or every resume when top_k is None.
+    """
+    n_jds, n_resumes = len(jds), len(resumes)
+    k = n_resumes if top_k is None else min(top_k, n_resumes)
+    jd_vectors = _unit_rows(model.encode(list(jds), batch_size=batch_size))
+    resume_vectors = _unit_rows(model.encode(list(resumes), batch_size=batch_size))
+
+    target_months = np.broadcast_to(np.multiply(required_years, 12.0), n_jds)
+    months = np.broadcast_to(np.asarray(resume_months, dtype=np.float64), n_resumes)
+
+    # One matcher over the union of all keywords; weights[u, j] is the share
+    # of JD j's keyword list taken by term u
+    matcher = compile_keywords(
+        tuple(dict.fromkeys(kw.lower() for kws in keywords_per_jd for kw in kws))
+    )
+    weights = np.zeros((len(matcher.terms), n_jds))
+    for j, kws in enumerate(keywords_per_jd):
+        for kw in kws:
+            weights[matcher.term_index[kw.lower()], j] += 1 / len(kws)
+    hits = matcher.hit_matrix([text.lower() for text in resumes]).astype(np.float64)
+    keyword_all = (hits @ weights).T  # (n_jds, n_resumes)
+    keyword_all[[not kws for kws in keywords_per_jd]] = 1.0
+
+    result = {
+        name: np.empty((n_jds, k), dtype=dtype)
+        for name, dtype in (
+            ("indices", np.int64),
+            ("final_score", np.float64),
+            ("relevance_score", np.float64),
+            ("keyword_score", np.float64),
+            ("experience_score", np.float64),
+        )
+    }
+    for start in range(0, n_jds, block_size):
+        rows = slice(start, min(start + block_size, n_jds))
+        relevance = jd_vectors[rows] @ resume_vectors.T
+        target = target_months[rows, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            experience = np.where(target > 0, np.minimum(months / target, 1.0), 1.0)
+        keyword = keyword_all[rows]
+        final = (
+            W_RELEVANCE * relevance + W_KEYWORDS * keyword + W_EXPERIENCE * experience
+        ) * 100
+
+        best = (
+            np.argpartition(-final, k - 1, axis=1)[:, :k]
+            if 0 < k < n_resumes
+            else np.tile(np.arange(n_resumes), (final.shape[0], 1))
+        )
+        best_final = np.take_along_axis(final, best, axis=1)
+        order = np.argsort(-best_final, axis=1, kind="stable")
+        best = np.take_along_axis(best, order, axis=1)
+        result["indices"][rows] = best
+        for name, values in (
+            ("final_score", final),
+            ("relevance_score", relevance),
+            ("keyword_score", keyword),
+            ("experience_score", experience),
+        ):
+            result[name][rows] = np.take_along_axis(values, best, axis=1)
+    return result
 
 
 def main():
@@ -248,6 +574,7 @@ def main():
     """
     REQUIRED_EXPERIENCE_YEARS = 3
     CANDIDATE_EXPERIENCE_YEARS = 1
+    TOP_CANDIDATES = 10  # best matches from the corpus to show
     # Try environment variable first (set by your upload handler), otherwise pick the most recent uploaded resume
     uploaded_env = os.environ.get("UPLOADED_RESUME_PATH") or os.environ.get(
         "UPLOADED_FILE"
@@ -288,46 +615,41 @@ def main():
     MUST_HAVE_KEYWORDS = suggested_keywords
 
     # --- 4. LOAD AND PREPROCESS DATABASE ---
-    PROCESSED_DATA_PATH = "resumes_with_vectors1.pkl"
-    model = SentenceTransformer("all-MiniLM-L6-v2")
+    PROCESSED_DATA_PATH = "resume_store"
+    LEGACY_DATA_PATH = "resumes_with_vectors1.pkl"
+    # Every encode goes through the embedding cache (see embedding_cache.py)
+    model = create_encoder("all-MiniLM-L6-v2")
 
     # --- THIS IS THE MISSING BLOCK ---
-    if os.path.exists(PROCESSED_DATA_PATH):
-        print(f"🚀 Found pre-processed data. Loading '{PROCESSED_DATA_PATH}'...")
-        resumes_df = pd.read_pickle(PROCESSED_DATA_PATH)
+    resumes = load_corpus(PROCESSED_DATA_PATH, LEGACY_DATA_PATH)
+    if resumes is not None:
+        print(f"🚀 Found pre-processed data. Loaded '{PROCESSED_DATA_PATH}'.")
     else:
         print("⏳ No pre-processed data found. Processing from scratch...")
         try:
-            with jsonlines.open("master_resumes_transformed[1].jsonl") as reader:
-                resumes_data = [line for line in reader]
-            resumes_df = pd.DataFrame(resumes_data)
-            print(f"✅ Loaded {len(resumes_df)} resumes from 'resume.jsonl'.")
+            resumes = ingest_jsonl(
+                "master_resumes_transformed[1].jsonl",
+                PROCESSED_DATA_PATH,
+                model.model,  # corpus texts are encoded once; skip the cache
+                dtype=os.environ.get("RESUME_STORE_DTYPE", "float32"),
+                workers=int(os.environ.get("INGEST_WORKERS", 0)) or None,
+                embed_workers=int(os.environ.get("EMBED_WORKERS", 0)),
+            )
+            print(f"✅ Loaded {len(resumes)} resumes from 'resume.jsonl'.")
+            print(f"✅ Saved processed data to '{PROCESSED_DATA_PATH}'.")
         except FileNotFoundError:
             print(
                 "⚠️ 'resume.jsonl' not found. Ranking against other candidates will be skipped."
             )
-            resumes_df = pd.DataFrame()
-
-        if not resumes_df.empty:
-            resumes_df["total_months_experience"] = resumes_df["experience"].apply(
-                lambda x: sum(
-                    int(
-                        re.search(
-                            r"(\d+)", job.get("dates", {}).get("duration", "0")
-                        ).group(1)
-                    )
-                    for job in x
-                    if isinstance(x, list)
-                )
-            )
-            resumes_df["resume_text"] = resumes_df.apply(consolidate_db_text, axis=1)
-            resumes_df.dropna(subset=["resume_text"], inplace=True)
-            resumes_df = resumes_df[resumes_df["resume_text"].str.strip() != ""].copy()
-            resumes_df["resume_vector"] = resumes_df["resume_text"].apply(
-                lambda x: model.encode(x)
-            )
-            resumes_df.to_pickle(PROCESSED_DATA_PATH)
-            print(f"✅ Saved processed data to '{PROCESSED_DATA_PATH}'.")
+            resumes = pd.DataFrame()
+
+    if isinstance(resumes, ResumeStore):
+        if resumes.token_index is None:
+            print("🗂️ Building keyword index...")
+            resumes.build_token_index()
+        if resumes.index is None and len(resumes) >= ANN_MIN_ROWS:
+            print("🗂️ Building approximate search index...")
+            resumes.build_index()
 
     # --- 5. ANALYZE AND SCORE ---
     print("\n" + "=" * 50 + "\nANALYZING YOUR RESUME\n" + "=" * 50)
@@ -336,14 +658,15 @@ def main():
     if user_resume_text:
         user_info = {"text": user_resume_text, "years_exp": CANDIDATE_EXPERIENCE_YEARS}
 
-        # Pass the correct resumes_df to the function
+        # Pass the loaded corpus to the function
         ranked_candidates, user_scores = score_and_rank(
             JOB_DESCRIPTION,
             REQUIRED_EXPERIENCE_YEARS,
             MUST_HAVE_KEYWORDS,
             model,
-            resumes_df,
+            resumes,
             user_info,
+            top_k=TOP_CANDIDATES,  # lets a store with an IVF index use it
         )
 
         user_score_reason = generate_score_explanation(
@@ -355,6 +678,15 @@ def main():
         print("-" * 55)
         print(f"Score Breakdown & Reasoning:\n{user_score_reason}")
         print("⭐" * 55)
+
+        if not ranked_candidates.empty:
+            print(f"\n🏆 Top {len(ranked_candidates)} candidates in the database:")
+            for rank, (_, row) in enumerate(ranked_candidates.iterrows(), 1):
+                print(
+                    f"{rank:>2}. {row['final_score']:5.1f}  "
+                    f"({row['total_months_experience']} months)  "
+                    f"{row['resume_text'][:60]}..."
+                )
     else:
         print("Could not process the user resume.")
 
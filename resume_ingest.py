@@ -0,0 +1,221 @@
+"""Streaming ingest of the resume corpus from JSONL into a ResumeStore.
+
+The file is read in chunks of raw lines. Worker processes decode them
+(orjson when installed, json otherwise) and build each resume's text and
+months of experience. Each chunk is embedded in length-sorted batches,
+by the main process or, with embed_workers, by the worker processes that
+decoded it, each holding its own copy of the model. The main process
+appends chunks to the store in file order, so at most a few chunks are in
+memory whatever the size of the corpus.
+
+Progress is checkpointed to <store>/ingest.ckpt after every chunk. An
+interrupted ingest resumes from the last finished chunk.
+"""
+
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from resume_store import ResumeStore, ResumeStoreWriter
+
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # fall back to the stdlib decoder
+    loads = json.loads
+
+
+def consolidate_db_text(row):
+    try:
+        summary = row.get("summary", "") or ""
+        skills_list = []
+        if isinstance(row.get("skills"), dict) and "technical" in row["skills"]:
+            for skill_cat in row["skills"]["technical"].values():
+                if isinstance(skill_cat, list):
+                    skills_list.extend([s.get("name", "") for s in skill_cat])
+        responsibilities = []
+        if isinstance(row.get("experience"), list):
+            for job in row["experience"]:
+                if isinstance(job.get("responsibilities"), list):
+                    responsibilities.extend(job["responsibilities"])
+        full_text = " ".join(
+            [summary] + list(dict.fromkeys(skills_list)) + responsibilities
+        )
+        return re.sub(r"\s+", " ", full_text).strip().lower()
+    except Exception:
+        return ""
+
+
+def resume_months(experience):
+    """Sum of the first number in each job's dates.duration"""
+    if not isinstance(experience, list):
+        return 0
+    months = 0
+    for job in experience:
+        dates = job.get("dates") if isinstance(job, dict) else None
+        duration = dates.get("duration", "0") if isinstance(dates, dict) else "0"
+        match = re.search(r"(\d+)", str(duration))
+        months += int(match.group(1)) if match else 0
+    return months
+
+
+def process_lines(lines):
+    """Decode JSONL lines into (texts, months), skipping bad or empty resumes"""
+    texts, months, skipped = [], [], 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = loads(line)
+        except ValueError:
+            skipped += 1
+            continue
+        text = consolidate_db_text(row) if isinstance(row, dict) else ""
+        if not text:
+            skipped += 1
+            continue
+        texts.append(text)
+        months.append(resume_months(row.get("experience")))
+    return texts, months, skipped
+
+
+def iter_line_chunks(path, chunk_size):
+    with open(path, "rb") as f:
+        chunk = []
+        for line in f:
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def encode_sorted(model, texts, batch_size):
+    """Encode texts in length-sorted batches, returned in the original order"""
+    order = np.argsort([len(text) for text in texts], kind="stable")
+    vectors = model.encode(
+        [texts[i] for i in order], batch_size=batch_size, show_progress_bar=False
+    )
+    out = np.empty_like(np.asarray(vectors, dtype=np.float32))
+    out[order] = vectors
+    return out
+
+
+_worker_model = None
+
+
+def _init_embed_worker(model_name):
+    global _worker_model
+    from sentence_transformers import SentenceTransformer
+
+    _worker_model = SentenceTransformer(model_name)
+
+
+def _embed_lines(lines, batch_size):
+    """process_lines plus the chunk's vectors, embedded in a worker process"""
+    texts, months, skipped = process_lines(lines)
+    return texts, months, skipped, encode_sorted(_worker_model, texts, batch_size)
+
+
+def ingest_jsonl(
+    path,
+    store_path,
+    model,
+    model_name="all-MiniLM-L6-v2",
+    dtype="float32",
+    chunk_size=2000,
+    batch_size=128,
+    workers=None,
+    embed_workers=0,
+):
+    """
+    Build a ResumeStore at store_path from a resume JSONL file. With
+    embed_workers > 0, chunks are decoded and embedded in that many worker
+    processes, each loading model_name, and model and workers are unused.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    workers = embed_workers or workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+    checkpoint_path = os.path.join(store_path, "ingest.ckpt")
+    resume = None
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if (checkpoint["source"], checkpoint["chunk_size"], checkpoint["dtype"]) == (
+            os.path.abspath(path),
+            chunk_size,
+            dtype,
+        ):
+            resume = checkpoint
+            print(f"♻️ Resuming ingest after chunk {resume['chunks']}.")
+
+    done = resume["chunks"] if resume else 0
+    skipped = resume["skipped"] if resume else 0
+    writer = ResumeStoreWriter(
+        store_path,
+        dtype=dtype,
+        model_name=model_name,
+        resume=resume["writer"] if resume else None,
+    )
+    context = multiprocessing.get_context("spawn")
+    if embed_workers:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_embed_worker,
+            initargs=(model_name,),
+        )
+        submit = lambda lines: pool.submit(_embed_lines, lines, batch_size)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        submit = lambda lines: pool.submit(process_lines, lines)
+    with writer, pool:
+        chunks = iter_line_chunks(path, chunk_size)
+        for _ in range(done):
+            next(chunks, None)
+
+        def save(result):
+            nonlocal done, skipped
+            texts, months, bad, *embedded = result
+            if texts:
+                # workers only return vectors when they embedded the chunk
+                vectors = (
+                    embedded[0] if embedded else encode_sorted(model, texts, batch_size)
+                )
+                writer.append(texts, months, vectors)
+            done += 1
+            skipped += bad
+            tmp_path = checkpoint_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "source": os.path.abspath(path),
+                        "chunk_size": chunk_size,
+                        "dtype": dtype,
+                        "chunks": done,
+                        "skipped": skipped,
+                        "writer": writer.checkpoint(),
+                    },
+                    f,
+                )
+            os.replace(tmp_path, checkpoint_path)
+            print(f"📥 Ingested {writer.count} resumes ({skipped} skipped)")
+
+        # Bounded window of chunks in flight, saved in file order
+        window = []
+        for lines in chunks:
+            window.append(submit(lines))
+            if len(window) >= workers * 2:
+                save(window.pop(0).result())
+        for future in window:
+            save(future.result())
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return ResumeStore(store_path)
@@ -0,0 +1,278 @@
+"""Memory-mapped resume vector store.
+
+A store is a directory holding one flat file per column:
+
+- vectors.bin: the (count, dim) embedding matrix as float32, float16 or int8
+- scales.bin: per-row float32 scales of int8 vectors (v ≈ q * scale)
+- norms.bin: per-row float32 L2 norms of the original vectors
+- text.bin / text_offsets.bin: UTF-8 resume texts and their int64 offsets
+- months.bin: int32 total months of experience
+- meta.json: count, dim, vector dtype and model name, written last
+- ivf_*.npy: an optional IVFIndex over the vectors (see ann_index.py)
+- token_*: an optional TokenIndex over the texts (see keyword_index.py)
+
+Every column is opened with np.memmap, so opening a store is instant, forked
+workers share its pages, and nothing is unpickled. A directory without
+meta.json is an unfinished build and refuses to open.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from ann_index import FILES as IVF_FILES, IVFIndex
+from keyword_index import TOKEN, TOKEN_FILES, TokenIndex, compile_keywords
+
+DTYPES = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+FORMAT_VERSION = 1
+
+
+class ResumeStoreWriter:
+    """
+    Appends resumes to a new store; the store is valid once closed.
+    Pass a dict from checkpoint() as resume to continue an interrupted build.
+    """
+
+    COLUMNS = ("vectors", "scales", "norms", "text", "text_offsets", "months")
+
+    def __init__(self, path, dtype="float32", model_name=None, resume=None):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unknown vector dtype: {dtype}")
+        self.path = path
+        self.dtype = dtype
+        self.model_name = model_name
+        self.count = resume["count"] if resume else 0
+        self.dim = resume["dim"] if resume else None
+        self.text_offset = resume["text_offset"] if resume else 0
+        os.makedirs(path, exist_ok=True)
+        # an old meta.json or index must not describe the new columns
+        for name in ("meta.json",) + IVF_FILES + TOKEN_FILES:
+            if os.path.exists(os.path.join(path, name)):
+                os.remove(os.path.join(path, name))
+        if resume is None:
+            self.files = {
+                name: open(os.path.join(path, name + ".bin"), "wb")
+                for name in self.COLUMNS
+            }
+            self.files["text_offsets"].write(np.zeros(1, dtype=np.int64).tobytes())
+        else:
+            # drop anything written after the checkpoint
+            self.files = {}
+            for name, size in self._sizes().items():
+                f = open(os.path.join(path, name + ".bin"), "r+b")
+                f.truncate(size)
+                f.seek(size)
+                self.files[name] = f
+
+    def _sizes(self):
+        """Expected byte size of each column file for the rows written so far"""
+        itemsize = np.dtype(DTYPES[self.dtype]).itemsize
+        return {
+            "vectors": self.count * (self.dim or 0) * itemsize,
+            "scales": self.count * 4 if self.dtype == "int8" else 0,
+            "norms": self.count * 4,
+            "text": self.text_offset,
+            "text_offsets": (self.count + 1) * 8,
+            "months": self.count * 4,
+        }
+
+    def checkpoint(self):
+        """Flush the columns and return the state needed to resume"""
+        for f in self.files.values():
+            f.flush()
+        return {"count": self.count, "dim": self.dim, "text_offset": self.text_offset}
+
+    def append(self, texts, months, vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if not len(texts) == len(months) == len(vectors):
+            raise ValueError("texts, months and vectors must have the same length")
+        if not len(texts):
+            return
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dim vectors, got {vectors.shape[1]}")
+
+        norms = np.linalg.norm(vectors, axis=1).astype(np.float32)
+        if self.dtype == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127
+            scales[scales == 0] = 1
+            stored = np.rint(vectors / scales[:, None]).astype(np.int8)
+            self.files["scales"].write(scales.astype(np.float32).tobytes())
+        else:
+            stored = vectors.astype(DTYPES[self.dtype])
+        self.files["vectors"].write(stored.tobytes())
+        self.files["norms"].write(norms.tobytes())
+
+        encoded = [text.encode("utf-8") for text in texts]
+        offsets = self.text_offset + np.cumsum([len(b) for b in encoded], dtype=np.int64)
+        self.files["text"].write(b"".join(encoded))
+        self.files["text_offsets"].write(offsets.tobytes())
+        self.text_offset = int(offsets[-1])
+        self.files["months"].write(np.asarray(months, dtype=np.int32).tobytes())
+        self.count += len(texts)
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+        meta = {
+            "version": FORMAT_VERSION,
+            "count": self.count,
+            "dim": self.dim or 0,
+            "dtype": self.dtype,
+            "model": self.model_name,
+        }
+        tmp_path = os.path.join(self.path, "meta.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, os.path.join(self.path, "meta.json"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            for f in self.files.values():
+                f.close()
+
+
+class ResumeStore:
+    """Read-only view of a store directory"""
+
+    def __init__(self, path):
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"No finished resume store at '{path}'")
+        with open(meta_path) as f:
+            self.meta = json.load(f)
+        if self.meta["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported store version: {self.meta['version']}")
+        self.path = path
+        self.count = self.meta["count"]
+        self.dim = self.meta["dim"]
+        self.dtype = self.meta["dtype"]
+        self.model_name = self.meta["model"]
+
+        self.raw_vectors = self._column("vectors", DTYPES[self.dtype], (self.count, self.dim))
+        self.scales = (
+            self._column("scales", np.float32, (self.count,))
+            if self.dtype == "int8"
+            else None
+        )
+        self.norms = self._column("norms", np.float32, (self.count,))
+        self.text_offsets = self._column("text_offsets", np.int64, (self.count + 1,))
+        self.text_data = self._column("text", np.uint8, (int(self.text_offsets[-1]),))
+        self.months = self._column("months", np.int32, (self.count,))
+        self.index = IVFIndex.load(path) if IVFIndex.exists(path) else None
+        self.token_index = (
+            TokenIndex.load(path) if TokenIndex.exists(path) else None
+        )
+
+    def build_index(self, **kwargs):
+        """Build and save an IVFIndex for approximate search"""
+        self.index = IVFIndex.build(self, **kwargs)
+        self.index.save(self.path)
+        return self.index
+
+    def build_token_index(self):
+        """Build and save a TokenIndex over the resume texts"""
+        texts = (self.text(i) for i in range(self.count))
+        self.token_index = TokenIndex.build(texts, self.path)
+        return self.token_index
+
+    def keyword_hits(self, keywords, rows):
+        """(len(rows), len(keywords)) bool matrix of keyword hits"""
+        matcher = compile_keywords(tuple(keywords))
+        if self.token_index is None:
+            return matcher.hit_matrix([self.text(i) for i in rows])
+        return self.token_index.hit_matrix(matcher, rows, self.text)
+
+    def rows_with_keywords(self, keywords):
+        """Sorted rows whose text contains every keyword"""
+        rows = np.arange(self.count)
+        if self.token_index is not None:
+            matcher = compile_keywords(tuple(keywords))
+            tokens = [token for term in matcher.terms for token in TOKEN.findall(term)]
+            if tokens:
+                rows = self.token_index.candidate_rows(tokens)
+        return rows[self.keyword_hits(keywords, rows).all(axis=1)]
+
+    def _column(self, name, dtype, shape):
+        if not np.prod(shape):
+            # np.memmap refuses empty files
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(
+            os.path.join(self.path, name + ".bin"), dtype=dtype, mode="r", shape=shape
+        )
+
+    def __len__(self):
+        return self.count
+
+    def text(self, i):
+        start, end = self.text_offsets[i], self.text_offsets[i + 1]
+        return self.text_data[start:end].tobytes().decode("utf-8")
+
+    def vectors(self, rows=None):
+        """Rows (all by default) as float32; zero-copy for float32 stores"""
+        raw = self.raw_vectors if rows is None else self.raw_vectors[rows]
+        if self.dtype == "float32":
+            return raw
+        vectors = raw.astype(np.float32)
+        if self.scales is not None:
+            scales = self.scales if rows is None else self.scales[rows]
+            vectors *= scales[:, None]
+        return vectors
+
+    def cosine(self, query_vector, rows=None, block_size=65536):
+        """Cosine similarity of query_vector to the given rows (all by default)"""
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1)
+        rows = np.arange(self.count) if rows is None else np.asarray(rows)
+        scores = np.empty(len(rows), dtype=np.float32)
+        for start in range(0, len(rows), block_size):
+            block = rows[start : start + block_size]
+            if len(block) and block[-1] - block[0] == len(block) - 1:
+                # contiguous run: slice the memmap instead of fancy indexing
+                block = slice(block[0], block[-1] + 1)
+            scores[start : start + block_size] = self.vectors(block) @ query
+        norms = self.norms[rows]
+        return scores / np.where(norms == 0, 1, norms)
+
+    def frame(self, rows=None):
+        """resume_text and total_months_experience of the rows as a DataFrame"""
+        import pandas as pd
+
+        rows = np.arange(self.count) if rows is None else np.asarray(rows)
+        return pd.DataFrame(
+            {
+                "resume_text": [self.text(i) for i in rows],
+                "total_months_experience": self.months[rows],
+            },
+            index=rows,
+        )
+
+    @classmethod
+    def build(cls, path, texts, months, vectors, dtype="float32", model_name=None):
+        with ResumeStoreWriter(path, dtype=dtype, model_name=model_name) as writer:
+            writer.append(texts, months, vectors)
+        return cls(path)
+
+    @classmethod
+    def from_dataframe(cls, path, df, dtype="float32", model_name=None):
+        """Convert a legacy DataFrame with a resume_vector column"""
+        vectors = (
+            np.vstack(df["resume_vector"].values)
+            if len(df)
+            else np.empty((0, 0), dtype=np.float32)
+        )
+        return cls.build(
+            path,
+            df["resume_text"].tolist(),
+            df["total_months_experience"].to_numpy(),
+            vectors,
+            dtype=dtype,
+            model_name=model_name,
+        )